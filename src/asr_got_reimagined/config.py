@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Optional, Type  # Added Type for settings_cls hint
+from typing import Any, Literal, Optional, Type  # Added Type for settings_cls hint
 import sys  # For type checking PydanticBaseSettingsSource
 
 import yaml
@@ -54,6 +54,8 @@ class ASRGoTDefaultParams(BaseModel):
         default_factory=list
     )
     dimension_confidence: list[float] = Field(default=[0.8, 0.8, 0.8, 0.8])
+    decomposition_batch_threshold: int = Field(default=500, ge=1)
+    decomposition_create_mode: Literal["merge", "unique"] = Field(default="merge")
     hypotheses_per_dimension: HypothesisParams = Field(
         default_factory=HypothesisParams, alias="hypotheses_per_dimension"
     )
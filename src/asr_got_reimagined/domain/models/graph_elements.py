@@ -25,6 +25,7 @@ class NodeType(str, Enum):
     EVIDENCE = "evidence"  # P1.4
     PLACEHOLDER_GAP = "placeholder_gap"  # P1.15
     INTERDISCIPLINARY_BRIDGE = "interdisciplinary_bridge"  # P1.8 (IBN)
+    HYPEREDGE_CENTER = "hyperedge_center"  # P1.9 (node standing in for a hyperedge in Neo4j)
     # Add more specific types as needed, e.g., Claim, Argument, Question
     RESEARCH_QUESTION = "research_question"
 
@@ -9,10 +9,11 @@ from asr_got_reimagined.domain.models.common_types import (
     ComposedOutput,
     GoTProcessorSessionData,
 )
+from asr_got_reimagined.domain.services.neo4j_utils import close_async_neo4j_driver
 from asr_got_reimagined.domain.stages.base_stage import BaseStage, StageOutput
 
-# Import the import_stages function for lazy loading
-from asr_got_reimagined.domain.stages import import_stages
+# Stage classes are resolved lazily by the stages package on first attribute access
+from asr_got_reimagined.domain import stages as stage_classes
 
 class GoTProcessor:
     def __init__(self, settings):
@@ -89,9 +90,6 @@ class GoTProcessor:
         
         This method initializes or continues a session, orchestrates the execution of all processing stages, logs detailed input and output information for each stage, handles errors (especially during initialization), and compiles the final results and metrics for the query.
         """
-        # Load stage classes lazily to avoid circular imports
-        _stages = import_stages()
-
         start_total_time = time.time()
         logger.info(f"Starting NexusMind query processing for: '{query[:100]}...'")
 
@@ -142,7 +140,7 @@ class GoTProcessor:
             logger.info(f"Executing stage {i + 1}/{len(self.stages)}: {stage_name_for_log} (Context Key: {current_stage_context_key})")
 
             logger.debug(f"--- Preparing for Stage: {stage_name_for_log} ---")
-            if current_stage_context_key == _stages["InitializationStage"].stage_name:
+            if current_stage_context_key == stage_classes.InitializationStage.stage_name:
                  logger.debug(f"Input for {stage_name_for_log}: Query='{query[:100]}...', InitialContextKeys={list(initial_context.keys()) if initial_context else []}, OpParamsKeys={list(op_params.keys())}")
             else:
                  context_keys = list(current_session_data.accumulated_context.keys())
@@ -150,7 +148,7 @@ class GoTProcessor:
             logger.debug(f"--- End Preparing for Stage: {stage_name_for_log} ---")
 
             try:
-                stage_result = await stage_instance.execute(current_session_data=current_session_data)
+                stage_result = await stage_instance.run(current_session_data=current_session_data)
 
                 logger.debug(f"--- Output from Stage: {stage_name_for_log} ---")
                 if isinstance(stage_result, StageOutput):
@@ -208,14 +206,14 @@ class GoTProcessor:
                     _update_trace_for_halt(log_message, reason_summary)
 
                 # Define stage names once to avoid repeating lookups
-                initialization_stage_name = _stages["InitializationStage"].stage_name
-                decomposition_stage_name = _stages["DecompositionStage"].stage_name
-                hypothesis_stage_name = _stages["HypothesisStage"].stage_name
-                evidence_stage_name = _stages["EvidenceStage"].stage_name
-                subgraph_extraction_stage_name = _stages["SubgraphExtractionStage"].stage_name
+                initialization_stage_name = stage_classes.InitializationStage.stage_name
+                decomposition_stage_name = stage_classes.DecompositionStage.stage_name
+                hypothesis_stage_name = stage_classes.HypothesisStage.stage_name
+                evidence_stage_name = stage_classes.EvidenceStage.stage_name
+                subgraph_extraction_stage_name = stage_classes.SubgraphExtractionStage.stage_name
                 
                 # --- Stage-Specific Halting Checks (using current_stage_context_key) ---
-                if current_stage_context_key == _stages["InitializationStage"].stage_name:
+                if current_stage_context_key == stage_classes.InitializationStage.stage_name:
                     init_context_data = current_session_data.accumulated_context.get(initialization_stage_name, {})
                     error_summary = None
                     if isinstance(stage_result, StageOutput) and stage_result.error_message:
@@ -279,8 +277,8 @@ class GoTProcessor:
                 break 
 
         # Get remaining stage names for final processing
-        composition_stage_name = _stages["CompositionStage"].stage_name
-        reflection_stage_name = _stages["ReflectionStage"].stage_name
+        composition_stage_name = stage_classes.CompositionStage.stage_name
+        reflection_stage_name = stage_classes.ReflectionStage.stage_name
         
         # --- Final Answer and Confidence Extraction ---
         if not current_session_data.final_answer: 
@@ -318,4 +316,4 @@ class GoTProcessor:
 
     async def shutdown_resources(self):
         logger.info("Shutting down GoTProcessor resources")
-        return
+        await close_async_neo4j_driver()
@@ -1,11 +1,23 @@
-from neo4j import GraphDatabase, Driver, Record, Result, Transaction, unit_of_work
-from neo4j.exceptions import Neo4jError, ServiceUnavailable
-from typing import Optional, Any, List, Dict
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    Driver,
+    GraphDatabase,
+    Record,
+    Result,
+    Transaction,
+    unit_of_work,
+)
+from neo4j.exceptions import Neo4jError, ServiceUnavailable, SessionExpired, TransientError
+from typing import Optional, Any, Awaitable, Callable, List, Dict, TypeVar
 import asyncio
 from loguru import logger
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+T = TypeVar("T")
+
 # --- Configuration ---
 class Neo4jSettings(BaseSettings):
     uri: str = "neo4j://localhost:7687"
@@ -18,6 +30,10 @@ class Neo4jSettings(BaseSettings):
 
 _neo4j_settings: Optional[Neo4jSettings] = None
 _driver: Optional[Driver] = None
+_async_driver: Optional[AsyncDriver] = None
+# Serializes first-time creation of `_async_driver`, so concurrent callers awaiting
+# `verify_connectivity` don't each build (and leak) their own driver
+_async_driver_lock = asyncio.Lock()
 
 def get_neo4j_settings() -> Neo4jSettings:
     """Returns the Neo4j settings, initializing them if necessary."""
@@ -64,6 +80,42 @@ def close_neo4j_driver() -> None:
     else:
         logger.info("Neo4j driver is already closed or not initialized.")
 
+async def get_async_neo4j_driver() -> AsyncDriver:
+    """
+    Initializes and returns the asyncio Neo4j driver, using the same singleton pattern
+    and credentials as `get_neo4j_driver`.
+    """
+    global _async_driver
+    if _async_driver is not None:
+        return _async_driver
+    async with _async_driver_lock:
+        # Another caller may have finished initializing while this one waited for the lock
+        if _async_driver is None:
+            settings = get_neo4j_settings()
+            logger.info(f"Initializing async Neo4j driver for URI: {settings.uri}")
+            driver = AsyncGraphDatabase.driver(settings.uri, auth=(settings.user, settings.password))
+            try:
+                await driver.verify_connectivity()
+            except ServiceUnavailable as e:
+                logger.error(f"Failed to connect to Neo4j at {settings.uri}: {e}")
+                await driver.close()
+                raise
+            except Exception as e:
+                logger.error(f"An unexpected error occurred while initializing async Neo4j driver: {e}")
+                await driver.close()
+                raise
+            _async_driver = driver
+            logger.info("Async Neo4j driver initialized and connectivity verified.")
+    return _async_driver
+
+async def close_async_neo4j_driver() -> None:
+    """Closes the asyncio Neo4j driver instance if it's open."""
+    global _async_driver
+    if _async_driver is not None:
+        logger.info("Closing async Neo4j driver.")
+        await _async_driver.close()
+        _async_driver = None
+
 # --- Query Execution ---
 async def execute_query(
     query: str,
@@ -135,6 +187,153 @@ async def execute_query(
 
     return records
 
+async def async_execute_query(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    database: Optional[str] = None,
+    tx_type: str = "read"  # 'read' or 'write'
+) -> List[Record]:
+    """
+    Executes a Cypher query on the asyncio driver.
+
+    Same contract as `execute_query`, but the round-trip is awaited on the event loop
+    instead of occupying a worker thread for its whole duration.
+
+    Raises:
+        ServiceUnavailable: If the driver cannot connect to Neo4j.
+        Neo4jError: For errors during query execution.
+        ValueError: If an invalid tx_type is provided.
+    """
+    if tx_type not in ("read", "write"):
+        logger.error(f"Invalid transaction type: {tx_type}. Must be 'read' or 'write'.")
+        raise ValueError(f"Invalid transaction type: {tx_type}. Must be 'read' or 'write'.")
+
+    driver = await get_async_neo4j_driver()
+    settings = get_neo4j_settings()
+    db_name = database if database else settings.database
+
+    @unit_of_work(timeout=30)
+    async def _transaction_work(tx: AsyncManagedTransaction) -> List[Record]:
+        result = await tx.run(query, parameters)
+        return [record async for record in result]
+
+    try:
+        async with driver.session(database=db_name) as session:
+            logger.debug(f"Executing async query on database '{db_name}' with type '{tx_type}': {query[:100]}...")
+            if tx_type == "read":
+                records = await session.execute_read(_transaction_work)
+            else:
+                records = await session.execute_write(_transaction_work)
+    except Neo4jError as e:
+        logger.error(f"Neo4j error executing Cypher query on database '{db_name}': {e}")
+        logger.error(f"Query: {query}, Parameters: {parameters}")
+        raise
+    except ServiceUnavailable:
+        logger.error(f"Neo4j service became unavailable while attempting to execute query on '{db_name}'.")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error executing Cypher query on database '{db_name}': {e}")
+        logger.error(f"Query: {query}, Parameters: {parameters}")
+        raise
+
+    logger.info(f"Query executed successfully on database '{db_name}'. Fetched {len(records)} records.")
+    return records
+
+async def execute_in_transaction(
+    work: Callable[..., Awaitable[T]],
+    *args: Any,
+    database: Optional[str] = None,
+    tx_type: str = "write",  # 'read' or 'write'
+) -> T:
+    """
+    Runs `await work(tx, *args)` inside a single managed transaction on the asyncio driver.
+
+    Prefer this over several `async_execute_query` calls when a stage issues dependent
+    statements (e.g. a lookup followed by a conditional write): they share one
+    transaction and one commit, and the driver retries them together on transient errors.
+    `work` may be called more than once on retry, so it must not have side effects
+    outside the transaction.
+
+    Args:
+        work: Coroutine function receiving the open `AsyncManagedTransaction` followed by `*args`.
+        *args: Extra positional arguments forwarded to `work`.
+        database: Optional name of the database to use. If None, uses default from settings.
+        tx_type: Type of transaction ('read' or 'write'). Defaults to 'write'.
+
+    Returns:
+        Whatever `work` returns.
+
+    Raises:
+        ServiceUnavailable: If the driver cannot connect to Neo4j.
+        Neo4jError: For errors during query execution.
+        ValueError: If an invalid tx_type is provided.
+    """
+    if tx_type not in ("read", "write"):
+        logger.error(f"Invalid transaction type: {tx_type}. Must be 'read' or 'write'.")
+        raise ValueError(f"Invalid transaction type: {tx_type}. Must be 'read' or 'write'.")
+
+    driver = await get_async_neo4j_driver()
+    settings = get_neo4j_settings()
+    db_name = database if database else settings.database
+
+    @unit_of_work(timeout=30)
+    async def _transaction_work(tx: AsyncManagedTransaction) -> T:
+        return await work(tx, *args)
+
+    try:
+        async with driver.session(database=db_name) as session:
+            logger.debug(f"Executing transaction function '{getattr(work, '__name__', work)}' on database '{db_name}' with type '{tx_type}'")
+            if tx_type == "read":
+                return await session.execute_read(_transaction_work)
+            return await session.execute_write(_transaction_work)
+    except Neo4jError as e:
+        logger.error(f"Neo4j error executing transaction on database '{db_name}': {e}")
+        raise
+    except ServiceUnavailable:
+        logger.error(f"Neo4j service became unavailable while attempting to execute transaction on '{db_name}'.")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error executing transaction on database '{db_name}': {e}")
+        raise
+
+# --- Schema Bootstrap ---
+# Idempotent schema statements the stages rely on so MERGE/MATCH by `id` is an index
+# lookup rather than a label scan. See docs_src/neo4j_indexing.md for the full set.
+_SCHEMA_STATEMENTS: List[str] = [
+    "CREATE CONSTRAINT node_id_unique IF NOT EXISTS FOR (n:Node) REQUIRE n.id IS UNIQUE",
+    # One ROOT per query: lets stage 1's MERGE on the query context lock out concurrent creators
+    "CREATE CONSTRAINT root_query_context_unique IF NOT EXISTS FOR (n:ROOT) REQUIRE n.metadata_query_context IS UNIQUE",
+    "CREATE INDEX decomposition_of_id IF NOT EXISTS FOR ()-[r:DECOMPOSITION_OF]-() ON (r.id)",
+    "CREATE INDEX generates_hypothesis_id IF NOT EXISTS FOR ()-[r:GENERATES_HYPOTHESIS]-() ON (r.id)",
+]
+_schema_ensured = False
+
+async def ensure_schema() -> None:
+    """
+    Creates the constraints and indexes in `_SCHEMA_STATEMENTS` once per process.
+
+    Safe to call from every stage execution: once every statement has been applied it
+    returns immediately. If the database is unreachable or a statement fails transiently,
+    nothing is recorded and the next call tries again. Other Neo4j errors (e.g. duplicate
+    ids blocking the uniqueness constraint, or missing schema privileges) are logged and
+    not retried, since queries still work without the indexes.
+    """
+    global _schema_ensured
+    if _schema_ensured:
+        return
+    for statement in _SCHEMA_STATEMENTS:
+        try:
+            await async_execute_query(statement, tx_type="write")
+        except (ServiceUnavailable, SessionExpired, TransientError) as e:
+            logger.warning(f"Could not apply Neo4j schema statement '{statement}', will retry on next call: {e}")
+            return
+        except Neo4jError as e:
+            logger.warning(f"Could not apply Neo4j schema statement '{statement}': {e}")
+        except Exception as e:
+            logger.warning(f"Unexpected error applying Neo4j schema statement '{statement}', will retry on next call: {e}")
+            return
+    _schema_ensured = True
+
 # Example of how to use (optional, for testing or demonstration)
 if __name__ == "__main__":
     logger.add("neo4j_utils.log", rotation="500 MB") # For local testing
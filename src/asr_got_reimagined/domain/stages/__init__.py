@@ -1,8 +1,10 @@
 # Makes 'stages' a sub-package.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base_stage import BaseStage, StageOutput
 
-# Import stage classes using a function to prevent circular imports
-def import_stages():
+if TYPE_CHECKING:
     from .stage_1_initialization import InitializationStage
     from .stage_2_decomposition import DecompositionStage
     from .stage_3_hypothesis import HypothesisStage
@@ -11,21 +13,33 @@ def import_stages():
     from .stage_6_subgraph_extraction import SubgraphExtractionStage
     from .stage_7_composition import CompositionStage
     from .stage_8_reflection import ReflectionStage
-    
-    return {
-        "InitializationStage": InitializationStage,
-        "DecompositionStage": DecompositionStage,
-        "HypothesisStage": HypothesisStage,
-        "EvidenceStage": EvidenceStage,
-        "PruningMergingStage": PruningMergingStage,
-        "SubgraphExtractionStage": SubgraphExtractionStage,
-        "CompositionStage": CompositionStage,
-        "ReflectionStage": ReflectionStage,
-    }
 
-# Export only the base classes at import time
+# Stage classes are imported on first attribute access (PEP 562) rather than at package
+# import: the stage modules import domain.services, whose package imports got_processor,
+# which in turn imports this package.
+_STAGE_MODULES = {
+    "InitializationStage": ".stage_1_initialization",
+    "DecompositionStage": ".stage_2_decomposition",
+    "HypothesisStage": ".stage_3_hypothesis",
+    "EvidenceStage": ".stage_4_evidence",
+    "PruningMergingStage": ".stage_5_pruning_merging",
+    "SubgraphExtractionStage": ".stage_6_subgraph_extraction",
+    "CompositionStage": ".stage_7_composition",
+    "ReflectionStage": ".stage_8_reflection",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _STAGE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    stage_cls = getattr(import_module(module_name, __name__), name)
+    globals()[name] = stage_cls  # Later lookups hit the module dict directly
+    return stage_cls
+
+
 __all__ = [
     "BaseStage",
     "StageOutput",
-    "import_stages",
+    *_STAGE_MODULES,
 ]
@@ -1,3 +1,4 @@
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
@@ -31,7 +32,7 @@ class BaseStage(ABC):
         self.settings = settings
         self.default_params = settings.asr_got.default_parameters
         # Log initialization
-        logger.debug(f"Initialized stage: {self.stage_name}")  # type: ignore
+        logger.debug("Initialized stage: {}", self.stage_name)  # type: ignore
 
     @abstractmethod
     async def execute(
@@ -52,12 +53,35 @@ class BaseStage(ABC):
         # This is an abstract method - concrete implementations must return a StageOutput
         raise NotImplementedError("Subclasses must implement execute method")
 
+    async def run(self, current_session_data: GoTProcessorSessionData) -> StageOutput:
+        """
+        Runs `execute` and records how long it took.
+
+        The pipeline calls this instead of `execute` directly, so every stage reports
+        its wall-clock time as `metrics["duration_ns"]` without timing code of its own.
+        """
+        start_ns = time.perf_counter_ns()
+        output = await self.execute(current_session_data=current_session_data)
+        duration_ns = time.perf_counter_ns() - start_ns
+        if isinstance(output, StageOutput):
+            output.metrics["duration_ns"] = duration_ns
+        logger.debug("Stage {} executed in {:.3f} ms", self.stage_name, duration_ns / 1_000_000)
+        return output
+
+    # Positional arguments are only interpolated by loguru once a sink accepts the
+    # record, so disabled levels never pay for formatting `output.metrics`.
     def _log_start(self, session_id: Optional[str]):
         logger.info(
-            f"[Session: {session_id or 'N/A'}] >>> Executing Stage: {self.stage_name} >>>"
+            "[Session: {}] >>> Executing Stage: {} >>>",
+            session_id or "N/A",
+            self.stage_name,
         )
 
     def _log_end(self, session_id: Optional[str], output: StageOutput):
         logger.info(
-            f"[Session: {session_id or 'N/A'}] <<< Completed Stage: {self.stage_name} | Summary: {output.summary} | Metrics: {output.metrics} <<<"
+            "[Session: {}] <<< Completed Stage: {} | Summary: {} | Metrics: {} <<<",
+            session_id or "N/A",
+            self.stage_name,
+            output.summary,
+            output.metrics,
         )
@@ -1,6 +1,8 @@
 from typing import Any
 
 from loguru import logger  # type: ignore
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict  # pydantic needs the typing_extensions variant before 3.12
 
 from asr_got_reimagined.config import Settings
 from asr_got_reimagined.domain.models.common import (
@@ -17,16 +19,84 @@ from asr_got_reimagined.domain.models.graph_elements import (
     NodeType,
 )
 # from asr_got_reimagined.domain.models.graph_state import ASRGoTGraph # No longer used
-from asr_got_reimagined.domain.services.neo4j_utils import execute_query, Neo4jError
+from asr_got_reimagined.domain.services.neo4j_utils import async_execute_query, ensure_schema, Neo4jError
+from asr_got_reimagined.domain.utils.neo4j_helpers import (
+    prepare_edge_properties_for_neo4j,
+    prepare_node_properties_for_neo4j,
+)
 from .stage_1_initialization import InitializationStage # For context key
 from asr_got_reimagined.domain.stages.base_stage import BaseStage, StageOutput
 
-import json # For property preparation
-from datetime import datetime # For property preparation
-from enum import Enum # For property preparation
-from typing import Dict, List, Set, Optional # For type hints
+from typing import Dict, List, Optional # For type hints
+
+# Cypher statements are kept as stable module-level strings so the server's plan cache keys on them
+# Only the two values the stage needs are projected, rather than the whole property map
+_FETCH_ROOT_Q = (
+    "MATCH (n:Node {id: $root_node_id}) "
+    "RETURN coalesce(n.metadata_query_context, n.label, 'Root Task') AS input_text, "
+    "coalesce(n.metadata_layer_id, $default_layer) AS layer"
+)
+
+# Every node written here is a decomposition dimension, so its type label is part of the
+# statement rather than added per row through apoc. It is SET after the MERGE (not put in
+# the MERGE pattern) so nodes left without it by earlier runs are still matched by id.
+_DIM_EXTRA_LABEL = NodeType.DECOMPOSITION_DIMENSION.value
+
+# Per-row write of one dimension node and its DECOMPOSITION_OF edge, keyed by create mode.
+# "merge" is idempotent, so replaying a session updates the same nodes. "unique" relies on
+# the dimension ids being new (they embed the fresh root id) and CREATEs without the MERGE
+# lookup; replaying such a session fails on the :Node(id) uniqueness constraint instead.
+_DIM_WRITE_CLAUSES: Dict[str, str] = {
+    "merge": f"""
+MERGE (d:Node {{id: item.props.id}}) SET d += item.props, d:`{_DIM_EXTRA_LABEL}`
+MERGE (d)-[r:DECOMPOSITION_OF {{id: item.edge_props.id}}]->(root_node)
+SET r += item.edge_props""",
+    "unique": f"""
+CREATE (d:Node:`{_DIM_EXTRA_LABEL}`) SET d = item.props
+CREATE (d)-[r:DECOMPOSITION_OF]->(root_node) SET r = item.edge_props""",
+}
+
+# Dimension nodes and their DECOMPOSITION_OF edges are written in one round-trip.
+# The root is matched once, before the UNWIND, rather than once per dimension row.
+# item.props.label is returned as created_label since the node props contain 'label'.
+_DIM_BATCH_QS: Dict[str, str] = {
+    mode: f"""
+MATCH (root_node:Node {{id: $root_id}})
+UNWIND $batch_data AS item{write_clause}
+RETURN d.id AS created_node_id, item.props.label AS created_label
+"""
+    for mode, write_clause in _DIM_WRITE_CLAUSES.items()
+}
+
+# Very large dimension lists are committed in batches by apoc.periodic.iterate instead of one
+# transaction. It only reports operation counts, so the written rows are read back afterwards.
+_DIM_PERIODIC_QS: Dict[str, str] = {
+    mode: f"""
+CALL apoc.periodic.iterate(
+  'UNWIND $batch_data AS item RETURN item',
+  'MATCH (root_node:Node {{id: $root_id}}){write_clause}',
+  {{batchSize: 1000, parallel: false, params: {{batch_data: $batch_data, root_id: $root_id}}}}
+) YIELD committedOperations, failedOperations, errorMessages
+RETURN committedOperations, failedOperations, errorMessages
+"""
+    for mode, write_clause in _DIM_WRITE_CLAUSES.items()
+}
+
+_DIM_READBACK_Q = """
+MATCH (root_node:Node {id: $root_id})<-[:DECOMPOSITION_OF]-(d:Node)
+WHERE d.id IN $dim_ids
+RETURN d.id AS created_node_id, d.label AS created_label
+"""
 
 
+class _DimensionSpec(TypedDict):
+    label: str
+    description: str
+
+
+# Built once: constructing a TypeAdapter compiles its validator
+_DIM_LIST_ADAPTER = TypeAdapter(List[_DimensionSpec])
+
 class DecompositionStage(BaseStage):
     stage_name: str = "DecompositionStage"
 
@@ -38,57 +108,17 @@ class DecompositionStage(BaseStage):
         self.dimension_confidence_values = (
             self.default_params.dimension_confidence
         )
-
-    def _prepare_node_properties_for_neo4j(self, node_pydantic: Node) -> Dict[str, Any]:
-        """Converts a Node Pydantic model into a flat dictionary for Neo4j."""
-        if node_pydantic is None: return {}
-        props = {"id": node_pydantic.id, "label": node_pydantic.label}
-        if node_pydantic.confidence:
-            for cv_field, cv_val in node_pydantic.confidence.model_dump().items():
-                if cv_val is not None: props[f"confidence_{cv_field}"] = cv_val
-        if node_pydantic.metadata:
-            for meta_field, meta_val in node_pydantic.metadata.model_dump().items():
-                if meta_val is None: continue
-                if isinstance(meta_val, datetime): props[f"metadata_{meta_field}"] = meta_val.isoformat()
-                elif isinstance(meta_val, Enum): props[f"metadata_{meta_field}"] = meta_val.value
-                elif isinstance(meta_val, (list, set)):
-                    if all(isinstance(item, (str, int, float, bool)) for item in meta_val):
-                        props[f"metadata_{meta_field}"] = list(meta_val)
-                    else:
-                        try:
-                            items_as_dicts = [item.model_dump() if hasattr(item, 'model_dump') else item for item in meta_val]
-                            props[f"metadata_{meta_field}_json"] = json.dumps(items_as_dicts)
-                        except TypeError as e:
-                            logger.warning(f"Could not serialize list/set metadata field {meta_field} to JSON: {e}")
-                            props[f"metadata_{meta_field}_str"] = str(meta_val)
-                elif hasattr(meta_val, 'model_dump'):
-                    try: props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump())
-                    except TypeError as e:
-                        logger.warning(f"Could not serialize Pydantic metadata field {meta_field} to JSON: {e}")
-                        props[f"metadata_{meta_field}_str"] = str(meta_val)
-                else: props[f"metadata_{meta_field}"] = meta_val
-        return {k: v for k, v in props.items() if v is not None}
-
-    def _prepare_edge_properties_for_neo4j(self, edge_pydantic: Edge) -> Dict[str, Any]:
-        """Converts an Edge Pydantic model into a flat dictionary for Neo4j."""
-        if edge_pydantic is None: return {}
-        props = {"id": edge_pydantic.id} # Type is handled by relationship type in query
-        # Add confidence if it exists and is not None
-        if hasattr(edge_pydantic, 'confidence') and edge_pydantic.confidence is not None:
-             props["confidence"] = edge_pydantic.confidence # Assuming confidence is a simple float for edges
-        
-        if edge_pydantic.metadata:
-            for meta_field, meta_val in edge_pydantic.metadata.model_dump().items():
-                if meta_val is None: continue
-                if isinstance(meta_val, datetime): props[f"metadata_{meta_field}"] = meta_val.isoformat()
-                elif isinstance(meta_val, Enum): props[f"metadata_{meta_field}"] = meta_val.value
-                # Simplified: assume edge metadata fields are simple or JSON serializable strings
-                elif isinstance(meta_val, (list,set,dict)) or hasattr(meta_val, 'model_dump'):
-                    try: props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump() if hasattr(meta_val, 'model_dump') else meta_val)
-                    except TypeError: props[f"metadata_{meta_field}_str"] = str(meta_val)
-                else: props[f"metadata_{meta_field}"] = meta_val
-        return {k: v for k, v in props.items() if v is not None}
-
+        self.batch_threshold = self.default_params.decomposition_batch_threshold
+        create_mode = self.default_params.decomposition_create_mode
+        self._dim_batch_query = _DIM_BATCH_QS[create_mode]
+        self._dim_periodic_query = _DIM_PERIODIC_QS[create_mode]
+        # Settings-derived and shared by every dimension node, so validated once here
+        self._dimension_confidence = ConfidenceVector.from_list(self.dimension_confidence_values)
+        # Default dimensions only depend on settings, so they are converted once per stage instance
+        self._default_dimensions_cached: List[Dict[str, Any]] = [
+            {"label": dim.label, "description": dim.description}
+            for dim in self.default_dimensions_config
+        ]
 
     def _get_conceptual_dimensions(
         self, 
@@ -99,18 +129,20 @@ class DecompositionStage(BaseStage):
         if custom_dimensions_input and isinstance(custom_dimensions_input, list):
             logger.info("Using custom decomposition dimensions provided in operational parameters.")
             # Basic validation: ensure items are dicts with 'label' and 'description'
-            return [
-                dim for dim in custom_dimensions_input 
-                if isinstance(dim, dict) and "label" in dim and "description" in dim
-            ]
+            try:
+                return _DIM_LIST_ADAPTER.validate_python(custom_dimensions_input)
+            except ValidationError as e:
+                # Drop only the malformed entries, as the previous per-item filter did
+                invalid_indices = {err["loc"][0] for err in e.errors() if err["loc"]}
+                logger.warning("Ignoring {} malformed custom decomposition dimension(s).", len(invalid_indices))
+                return [
+                    dim for i, dim in enumerate(custom_dimensions_input) if i not in invalid_indices
+                ]
         else:
             logger.info("Using default decomposition dimensions from configuration.")
             # Adapt default dimensions, possibly incorporating root_node_query_context
-            # For now, directly using configured defaults.
-            return [
-                {"label": dim.label, "description": dim.description}
-                for dim in self.default_dimensions_config
-            ]
+            # For now, directly using configured defaults. Shallow copy so callers can't mutate the cache.
+            return list(self._default_dimensions_cached)
 
     async def execute(
         self, current_session_data: GoTProcessorSessionData # graph: ASRGoTGraph removed
@@ -122,7 +154,8 @@ class DecompositionStage(BaseStage):
         )
         root_node_id = initialization_data.get("root_node_id")
         # Ensure disciplinary_tags is a list of strings
-        initial_disciplinary_tags: Set[str] = set(initialization_data.get("initial_disciplinary_tags", []))
+        # Sorted once so every dimension node stores the tags in the same, stable order
+        initial_disciplinary_tags: List[str] = sorted(set(initialization_data.get("initial_disciplinary_tags", [])))
 
 
         if not root_node_id:
@@ -131,159 +164,144 @@ class DecompositionStage(BaseStage):
             return StageOutput(summary=err_msg, metrics={"dimensions_created_in_neo4j": 0, "relationships_created_in_neo4j": 0},
                                next_stage_context_update={self.stage_name: {"error": err_msg, "dimension_node_ids": []}})
         
-        # Fetch root node's query context or label for decomposition input
-        root_node_info: Optional[Dict[str, Any]] = None
-        try:
-            query = "MATCH (n:Node {id: $root_node_id}) RETURN properties(n) AS props"
-            results = execute_query(query, {"root_node_id": root_node_id}, tx_type="read")
-            if results and results[0].get("props"):
-                root_node_info = results[0]["props"]
-            else:
-                err_msg = f"Root node {root_node_id} not found in Neo4j."
+        # Stage 1 publishes the ROOT properties it wrote; only fall back to Neo4j when absent
+        root_node_info: Optional[Dict[str, Any]] = initialization_data.get("root_node_properties")
+
+        operational_params = current_session_data.accumulated_context.get("operational_params", {})
+        custom_dimensions_input = operational_params.get("decomposition_dimensions")
+
+        dimensions_to_create_conceptual = self._get_conceptual_dimensions(
+            root_node_info.get("metadata_query_context") if root_node_info else None, custom_dimensions_input
+        )
+        # Checked before the root read so a session with nothing to decompose costs no round-trip
+        if not dimensions_to_create_conceptual:
+            logger.warning("No decomposition dimensions configured; skipping dimension creation.")
+            output = StageOutput(summary="No decomposition dimensions configured.",
+                                 metrics={"dimensions_created_in_neo4j": 0, "relationships_created_in_neo4j": 0},
+                                 next_stage_context_update={self.stage_name: {"dimension_node_ids": [], "decomposition_results": []}})
+            self._log_end(current_session_data.session_id, output)
+            return output
+
+        if root_node_info:
+            # Use metadata_query_context if available, else label, else a default string
+            decomposition_input_text = root_node_info.get("metadata_query_context") or root_node_info.get("label", "Root Task")
+            root_node_layer_str = root_node_info.get("metadata_layer_id") or self.default_params.initial_layer
+        else:
+            try:
+                results = await async_execute_query(
+                    _FETCH_ROOT_Q,
+                    {"root_node_id": root_node_id, "default_layer": self.default_params.initial_layer},
+                    tx_type="read",
+                )
+                if results:
+                    decomposition_input_text = results[0]["input_text"]
+                    root_node_layer_str = results[0]["layer"]
+                else:
+                    err_msg = f"Root node {root_node_id} not found in Neo4j."
+                    logger.error(err_msg)
+                    return StageOutput(summary=err_msg, metrics={"dimensions_created_in_neo4j": 0, "relationships_created_in_neo4j": 0},
+                                       next_stage_context_update={self.stage_name: {"error": err_msg, "dimension_node_ids": []}})
+            except Neo4jError as e:
+                err_msg = f"Neo4j error fetching root node {root_node_id}: {e}"
                 logger.error(err_msg)
                 return StageOutput(summary=err_msg, metrics={"dimensions_created_in_neo4j": 0, "relationships_created_in_neo4j": 0},
                                    next_stage_context_update={self.stage_name: {"error": err_msg, "dimension_node_ids": []}})
-        except Neo4jError as e:
-            err_msg = f"Neo4j error fetching root node {root_node_id}: {e}"
-            logger.error(err_msg)
-            return StageOutput(summary=err_msg, metrics={"dimensions_created_in_neo4j": 0, "relationships_created_in_neo4j": 0},
-                               next_stage_context_update={self.stage_name: {"error": err_msg, "dimension_node_ids": []}})
 
-        # Use metadata_query_context if available, else label, else a default string
-        decomposition_input_text = root_node_info.get("metadata_query_context") or root_node_info.get("label", "Root Task")
-        root_node_layer_str = root_node_info.get("metadata_layer_id", self.default_params.initial_layer)
 
-
-        operational_params = current_session_data.accumulated_context.get("operational_params", {})
-        custom_dimensions_input = operational_params.get("decomposition_dimensions")
-        
-        dimensions_to_create_conceptual = self._get_conceptual_dimensions(decomposition_input_text, custom_dimensions_input)
-
-        dimension_node_ids_created: List[str] = []
+        # Built in the same pass as the result loop; ids/labels are derived from it afterwards
+        decomposition_results_for_context: List[Dict[str, str]] = []
         nodes_created_count = 0
         edges_created_count = 0
-        dimension_labels_created: List[str] = []
         
         batch_dimension_node_data = []
-        created_dimensions_map: Dict[str, str] = {} # original_id to created_node_id
 
-        for i, dim_data in enumerate(dimensions_to_create_conceptual):
-            dim_label = dim_data.get("label", f"Dimension {i + 1}")
-            dim_description = dim_data.get("description", f"Details for {dim_label}")
-            # Make dim_id deterministic for mapping if needed, or use original_dim_data.label if unique
-            original_dim_identifier = dim_data.get("id", dim_label) # Assuming label is unique enough for mapping or dim_data has a unique 'id'
-            dim_id_neo4j = f"dim_{root_node_id}_{i}" # Neo4j node ID
-
-            dim_metadata = NodeMetadata(
-                description=dim_description,
+        # Every dimension node shares its confidence and metadata apart from the description, so
+        # the flattened properties are computed once from a template node and copied per dimension.
+        # The templates are only flattened, never returned, and every value is already the
+        # field's type, so model_construct() skips validation (defaults are still applied).
+        template_node_pydantic = Node.model_construct(
+            id="dim_template", label="dim_template", type=NodeType.DECOMPOSITION_DIMENSION,
+            confidence=self._dimension_confidence,
+            metadata=NodeMetadata.model_construct(
                 source_description="DecompositionStage (P1.2)",
                 epistemic_status=EpistemicStatus.ASSUMPTION,
-                disciplinary_tags=list(initial_disciplinary_tags),
+                disciplinary_tags=set(initial_disciplinary_tags),
                 layer_id=operational_params.get("dimension_layer", root_node_layer_str),
                 impact_score=0.7,
-            )
-            dimension_node_pydantic = Node(
-                id=dim_id_neo4j, label=dim_label, type=NodeType.DECOMPOSITION_DIMENSION,
-                confidence=ConfidenceVector.from_list(self.dimension_confidence_values),
-                metadata=dim_metadata
-            )
-            node_props_for_neo4j = self._prepare_node_properties_for_neo4j(dimension_node_pydantic)
-            type_label_value = NodeType.DECOMPOSITION_DIMENSION.value
-            
+            ),
+        )
+        template_node_props = prepare_node_properties_for_neo4j(template_node_pydantic)
+        # Same for the DECOMPOSITION_OF edges, which differ only in id and description
+        template_edge_props = prepare_edge_properties_for_neo4j(Edge.model_construct(
+            id="edge_template", source_id="dim_template", target_id=root_node_id,
+            type=EdgeType.DECOMPOSITION_OF, confidence=0.95, metadata=EdgeMetadata.model_construct(),
+        ))
+        decomposition_input_excerpt = decomposition_input_text[:30]
+        # Fixed id templates are split into prefix/suffix once so the loop only concatenates
+        dim_id_prefix = "dim_" + str(root_node_id) + "_"
+        edge_id_suffix = "_decompof_" + str(root_node_id)
+
+        for i, dim_data in enumerate(dimensions_to_create_conceptual):
+            dim_label = dim_data.get("label", f"Dimension {i + 1}")
+            dim_description = dim_data.get("description", f"Details for {dim_label}")
+            dim_id_neo4j = dim_id_prefix + str(i) # Neo4j node ID
+
+            node_props_for_neo4j = template_node_props.copy()
+            node_props_for_neo4j["id"] = dim_id_neo4j
+            node_props_for_neo4j["label"] = dim_label
+            if dim_description is not None:
+                node_props_for_neo4j["metadata_description"] = dim_description
+
+            # The dimension ID is generated client-side, so its edge to the root can be
+            # prepared now and written by the same query as the node.
+            edge_props_for_neo4j = template_edge_props.copy()
+            edge_props_for_neo4j["id"] = "edge_" + dim_id_neo4j + edge_id_suffix
+            edge_props_for_neo4j["metadata_description"] = f"'{dim_label}' is a decomposition of '{decomposition_input_excerpt}...'"
+
             batch_dimension_node_data.append({
                 "props": node_props_for_neo4j, 
-                "type_label_value": type_label_value,
-                "original_identifier": original_dim_identifier # To map back if needed
+                "edge_props": edge_props_for_neo4j,
             })
 
         if batch_dimension_node_data:
+            await ensure_schema() # MERGE on :Node(id) needs the uniqueness constraint to avoid label scans
             try:
-                batch_node_query = """
-                UNWIND $batch_data AS item
-                MERGE (d:Node {id: item.props.id}) SET d += item.props
-                WITH d, item.type_label_value AS typeLabelValue CALL apoc.create.addLabels(d, [typeLabelValue]) YIELD node
-                RETURN node.id AS created_node_id, item.props.label AS created_label, item.original_identifier AS original_identifier
-                """
-                # Using item.props.label as created_label since node_props_for_neo4j contains 'label'
-                results_nodes = execute_query(batch_node_query, {"batch_data": batch_dimension_node_data}, tx_type='write')
+                batch_params = {"batch_data": batch_dimension_node_data, "root_id": root_node_id}
+                if len(batch_dimension_node_data) > self.batch_threshold:
+                    periodic_results = await async_execute_query(self._dim_periodic_query, batch_params, tx_type='write')
+                    if periodic_results and periodic_results[0]["failedOperations"]:
+                        logger.error("apoc.periodic.iterate failed {} dimension writes: {}",
+                                     periodic_results[0]["failedOperations"], periodic_results[0]["errorMessages"])
+                    results_nodes = await async_execute_query(
+                        _DIM_READBACK_Q,
+                        {"root_id": root_node_id, "dim_ids": [item["props"]["id"] for item in batch_dimension_node_data]},
+                        tx_type="read",
+                    )
+                else:
+                    results_nodes = await async_execute_query(self._dim_batch_query, batch_params, tx_type='write')
                 
                 for record in results_nodes:
                     created_node_id = record["created_node_id"]
                     created_label = record["created_label"] # This is the label from props, e.g., "Scope"
-                    original_identifier = record["original_identifier"] # The original unique key for this dim_data
 
-                    dimension_node_ids_created.append(created_node_id)
-                    dimension_labels_created.append(created_label) # Store the actual label used
+                    decomposition_results_for_context.append({"id": created_node_id, "label": created_label}) # Store the actual label used
                     nodes_created_count += 1
-                    created_dimensions_map[original_identifier] = created_node_id # Map original id to Neo4j id
-                    logger.debug(f"Batch created/merged dimension node '{created_label}' (ID: {created_node_id}).")
-
-            except Neo4jError as e:
-                logger.error(f"Neo4j error during batch dimension node creation: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error during batch dimension node creation: {e}")
-        
-        # Relationship Batching
-        batch_relationship_data = []
-        if dimension_node_ids_created: # Only proceed if nodes were created
-            # Iterate through the original conceptual dimensions to prepare relationship data
-            # using the mapping `created_dimensions_map`
-            for i, dim_data in enumerate(dimensions_to_create_conceptual):
-                original_dim_identifier = dim_data.get("id", dim_data.get("label", f"Dimension {i+1}"))
-                created_dimension_id = created_dimensions_map.get(original_dim_identifier)
-                
-                if not created_dimension_id:
-                    logger.warning(f"Could not find created Neo4j ID for original dimension identifier '{original_dim_identifier}'. Skipping relationship creation.")
-                    continue
-
-                dim_label_for_edge = dim_data.get("label", f"Dimension {i+1}") # For edge description
+                    edges_created_count += 1 # One DECOMPOSITION_OF edge per returned row
+                    logger.debug(f"Batch created/merged dimension node '{created_label}' (ID: {created_node_id}) and its DECOMPOSITION_OF edge.")
 
-                edge_id = f"edge_{created_dimension_id}_decompof_{root_node_id}"
-                edge_pydantic = Edge(
-                    id=edge_id, source_id=created_dimension_id, target_id=root_node_id,
-                    type=EdgeType.DECOMPOSITION_OF, confidence=0.95,
-                    metadata=EdgeMetadata(description=f"'{dim_label_for_edge}' is a decomposition of '{decomposition_input_text[:30]}...'")
-                )
-                edge_props_for_neo4j = self._prepare_edge_properties_for_neo4j(edge_pydantic)
-                batch_relationship_data.append({
-                    "dim_id": created_dimension_id, 
-                    "root_id": root_node_id, 
-                    "props": edge_props_for_neo4j
-                })
-        
-        if batch_relationship_data:
-            try:
-                batch_rel_query = """
-                UNWIND $batch_rels AS rel_detail
-                MATCH (dim_node:Node {id: rel_detail.dim_id})
-                MATCH (root_node:Node {id: rel_detail.root_id})
-                MERGE (dim_node)-[r:DECOMPOSITION_OF {id: rel_detail.props.id}]->(root_node)
-                SET r += rel_detail.props
-                RETURN count(r) AS total_rels_created
-                """
-                result_rels = execute_query(batch_rel_query, {"batch_rels": batch_relationship_data}, tx_type='write')
-                if result_rels and result_rels[0].get("total_rels_created") is not None:
-                    edges_created_count = result_rels[0]["total_rels_created"]
-                    logger.debug(f"Batch created {edges_created_count} DECOMPOSITION_OF relationships.")
-                else:
-                    logger.error("Batch relationship creation query did not return expected count.")
             except Neo4jError as e:
-                logger.error(f"Neo4j error during batch DECOMPOSITION_OF relationship creation: {e}")
+                logger.error(f"Neo4j error during batch dimension node/relationship creation: {e}")
             except Exception as e:
-                logger.error(f"Unexpected error during batch DECOMPOSITION_OF relationship creation: {e}")
+                logger.error(f"Unexpected error during batch dimension node/relationship creation: {e}")
 
-        summary = f"Task decomposed into {nodes_created_count} dimensions in Neo4j: {', '.join(dimension_labels_created)}."
+        summary = f"Task decomposed into {nodes_created_count} dimensions in Neo4j: {', '.join(d['label'] for d in decomposition_results_for_context)}."
         metrics = {
             "dimensions_created_in_neo4j": nodes_created_count,
             "relationships_created_in_neo4j": edges_created_count,
         }
         # Ensure decomposition_results key is populated if other stages expect it.
         # The prompt for stage-skipping logic in got_processor.py assumes a "decomposition_results" key.
-        # This key should contain the actual dimension data, not just IDs.
-        # For now, dimension_node_ids_created is what we have. If fuller results are needed, this needs adjustment.
-        decomposition_results_for_context = [
-            {"id": node_id, "label": label} for node_id, label in zip(dimension_node_ids_created, dimension_labels_created)
-        ]
+        dimension_node_ids_created = [d["id"] for d in decomposition_results_for_context]
 
         context_update = {
             "dimension_node_ids": dimension_node_ids_created,
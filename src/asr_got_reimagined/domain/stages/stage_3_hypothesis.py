@@ -1,3 +1,4 @@
+import asyncio
 import random
 from typing import Any
 
@@ -21,11 +22,12 @@ from asr_got_reimagined.domain.models.graph_elements import (
     Plan,
 )
 # from asr_got_reimagined.domain.models.graph_state import ASRGoTGraph # No longer used
-from asr_got_reimagined.domain.services.neo4j_utils import execute_query, Neo4jError # Import Neo4j utils
+from asr_got_reimagined.domain.services.neo4j_utils import async_execute_query, ensure_schema, Neo4jError # Import Neo4j utils
+from asr_got_reimagined.domain.utils.neo4j_helpers import (
+    prepare_edge_properties_for_neo4j,
+    prepare_node_properties_for_neo4j,
+)
 
-import json # For property preparation
-from datetime import datetime # For property preparation
-from enum import Enum # For property preparation
 from typing import Dict, List, Set, Optional, Union # For type hints
 
 from asr_got_reimagined.domain.stages.base_stage import BaseStage, StageOutput
@@ -33,6 +35,43 @@ from asr_got_reimagined.domain.stages.base_stage import BaseStage, StageOutput
 # Import names of previous stages to access their output keys in accumulated_context
 from .stage_2_decomposition import DecompositionStage
 
+# Dimensions are fetched together; dimensions missing from the graph simply return no row.
+# Only the properties hypothesis generation reads are projected, not the whole property map.
+_FETCH_DIMS_Q = """
+UNWIND $dimension_ids AS dim_id
+MATCH (d:Node {id: dim_id})
+RETURN dim_id, d.label AS label, d.metadata_disciplinary_tags AS tags, d.metadata_layer_id AS layer_id
+"""
+
+# Hypothesis nodes and their GENERATES_HYPOTHESIS edges are written in one round-trip.
+# The type label is fixed for this stage, so it is SET statically after the MERGE on
+# :Node(id) rather than added per row through apoc.create.addLabels.
+_HYPO_BATCH_Q = f"""
+UNWIND $batch_data AS item
+MATCH (dim:Node {{id: item.dim_id_source}})
+MERGE (h:Node {{id: item.props.id}}) SET h += item.props, h:`{NodeType.HYPOTHESIS.value}`
+MERGE (dim)-[r:GENERATES_HYPOTHESIS {{id: item.edge_props.id}}]->(h)
+SET r += item.edge_props
+RETURN h.id AS created_hyp_id, item.dim_id_source AS dim_id_source, item.hypo_label_original AS hypo_label
+"""
+
+# Large runs are written in sub-batches of about this many rows so no single transaction holds
+# tens of thousands of them; a few sub-batches are in flight at once to keep the driver busy.
+# Sub-batches are split on dimension boundaries: every row MATCHes its dimension node and
+# creates a relationship on it, so concurrent transactions sharing a dimension would contend
+# for that node's lock (and risk deadlocks).
+_HYPO_BATCH_SIZE = 1000
+_HYPO_WRITE_CONCURRENCY = 4
+
+# Enum members used for every hypothesis, resolved once at import
+_HYPO_NODE_TYPE = NodeType.HYPOTHESIS
+_GEN_HYPO_EDGE = EdgeType.GENERATES_HYPOTHESIS
+_EPI_HYPO = EpistemicStatus.HYPOTHESIS
+
+# Choice pools for the simulated hypothesis content
+_PLAN_RESOURCES = ("dataset_X", "computational_cluster", "expert_A")
+_FALSIFICATION_METRICS = ("key_metric_A", "key_metric_B")
+
 
 class HypothesisStage(BaseStage):
     stage_name: str = "HypothesisStage"
@@ -43,57 +82,17 @@ class HypothesisStage(BaseStage):
         self.k_max_hypotheses = self.default_params.hypotheses_per_dimension.max_hypotheses
         self.hypothesis_confidence_values = self.default_params.hypothesis_confidence
         self.default_disciplinary_tags_config = self.default_params.default_disciplinary_tags
+        self._default_tags_tuple = tuple(self.default_disciplinary_tags_config)
+        self._max_sampled_tags = min(2, len(self._default_tags_tuple))
         self.default_plan_types_config = self.default_params.default_plan_types
-
-    def _prepare_node_properties_for_neo4j(self, node_pydantic: Node) -> Dict[str, Any]:
-        """Converts a Node Pydantic model into a flat dictionary for Neo4j."""
-        if node_pydantic is None: return {}
-        props = {"id": node_pydantic.id, "label": node_pydantic.label}
-        if node_pydantic.confidence:
-            for cv_field, cv_val in node_pydantic.confidence.model_dump().items():
-                if cv_val is not None: props[f"confidence_{cv_field}"] = cv_val
-        if node_pydantic.metadata:
-            for meta_field, meta_val in node_pydantic.metadata.model_dump().items():
-                if meta_val is None: continue
-                if isinstance(meta_val, datetime): props[f"metadata_{meta_field}"] = meta_val.isoformat()
-                elif isinstance(meta_val, Enum): props[f"metadata_{meta_field}"] = meta_val.value
-                elif isinstance(meta_val, (list, set)):
-                    if all(isinstance(item, (str, int, float, bool)) for item in meta_val):
-                        props[f"metadata_{meta_field}"] = list(meta_val)
-                    else:
-                        try:
-                            items_as_dicts = [item.model_dump() if hasattr(item, 'model_dump') else item for item in meta_val]
-                            props[f"metadata_{meta_field}_json"] = json.dumps(items_as_dicts)
-                        except TypeError as e:
-                            logger.warning(f"Could not serialize list/set metadata field {meta_field} to JSON: {e}")
-                            props[f"metadata_{meta_field}_str"] = str(meta_val)
-                elif hasattr(meta_val, 'model_dump'): # Handles Plan, FalsificationCriteria, BiasFlag if they are direct fields
-                    try: props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump())
-                    except TypeError as e:
-                        logger.warning(f"Could not serialize Pydantic metadata field {meta_field} to JSON: {e}")
-                        props[f"metadata_{meta_field}_str"] = str(meta_val)
-                else: props[f"metadata_{meta_field}"] = meta_val
-        return {k: v for k, v in props.items() if v is not None}
-
-    def _prepare_edge_properties_for_neo4j(self, edge_pydantic: Edge) -> Dict[str, Any]:
-        """Converts an Edge Pydantic model into a flat dictionary for Neo4j."""
-        if edge_pydantic is None: return {}
-        props = {"id": edge_pydantic.id}
-        if hasattr(edge_pydantic, 'confidence') and edge_pydantic.confidence is not None:
-             props["confidence"] = edge_pydantic.confidence
-        if edge_pydantic.metadata:
-            for meta_field, meta_val in edge_pydantic.metadata.model_dump().items():
-                if meta_val is None: continue
-                if isinstance(meta_val, datetime): props[f"metadata_{meta_field}"] = meta_val.isoformat()
-                elif isinstance(meta_val, Enum): props[f"metadata_{meta_field}"] = meta_val.value
-                elif isinstance(meta_val, (list,set,dict)) or hasattr(meta_val, 'model_dump'):
-                    try: props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump() if hasattr(meta_val, 'model_dump') else meta_val)
-                    except TypeError: props[f"metadata_{meta_field}_str"] = str(meta_val)
-                else: props[f"metadata_{meta_field}"] = meta_val
-        return {k: v for k, v in props.items() if v is not None}
+        # Settings-derived and shared by every hypothesis node, so validated once here
+        self._hypothesis_confidence = ConfidenceVector.from_list(self.hypothesis_confidence_values)
+        # One generator bound per stage, so the simulated content can be seeded as a whole
+        self._rng = random.Random()
 
     async def _generate_hypothesis_content(
-        self, dimension_label: str, dimension_tags: Set[str], hypo_index: int, initial_query: str
+        self, dimension_label: str, dimension_tags: Set[str], hypo_index: int, initial_query: str,
+        plan_type: str, required_resource: str, falsification_metric: str,
     ) -> dict[str, Any]:
         """
         Generates the content dictionary for a single hypothesis.
@@ -102,39 +101,82 @@ class HypothesisStage(BaseStage):
             dimension_tags: Disciplinary tags from the dimension node.
             hypo_index: Index of the hypothesis for this dimension.
             initial_query: The original query string.
+            plan_type: Plan type, drawn by the caller for the whole dimension at once.
+            required_resource: Resource the plan requires, drawn likewise.
+            falsification_metric: Metric named in the falsification criteria, drawn likewise.
         Returns:
             A dictionary for hypothesis metadata.
         """
         base_hypothesis_text = f"Hypothesis {hypo_index + 1} regarding '{dimension_label}' for query '{initial_query[:30]}...'"
-        plan_type = random.choice(self.default_plan_types_config)
-        plan_pydantic = Plan(
+        # The sub-models are built from settings and in-range draws, so like the node models in
+        # execute() they skip validation via model_construct()
+        plan_pydantic = Plan.model_construct(
             type=plan_type, description=f"Plan to evaluate '{base_hypothesis_text}' via {plan_type}.",
-            estimated_cost=random.uniform(0.2, 0.8), estimated_duration=random.uniform(1.0, 5.0),
-            required_resources=[random.choice(["dataset_X", "computational_cluster", "expert_A"])]
+            estimated_cost=self._rng.uniform(0.2, 0.8), estimated_duration=self._rng.uniform(1.0, 5.0),
+            required_resources=[required_resource]
         )
-        fals_conditions = [f"Observe contradictory evidence from {plan_type}", f"Find statistical insignificance in {random.choice(['key_metric_A', 'key_metric_B'])}"]
-        falsifiability_pydantic = FalsificationCriteria(
+        fals_conditions = [f"Observe contradictory evidence from {plan_type}", f"Find statistical insignificance in {falsification_metric}"]
+        falsifiability_pydantic = FalsificationCriteria.model_construct(
             description=f"This hypothesis could be falsified if {fals_conditions[0].lower()} or if {fals_conditions[1].lower()}.",
             testable_conditions=fals_conditions
         )
         bias_flags_list = []
-        if random.random() < 0.15:
-            bias_type = random.choice(["Confirmation Bias", "Availability Heuristic", "Anchoring Bias"])
-            bias_flags_list.append(BiasFlag(
+        if self._rng.random() < 0.15:
+            bias_type = self._rng.choice(["Confirmation Bias", "Availability Heuristic", "Anchoring Bias"])
+            bias_flags_list.append(BiasFlag.model_construct(
                 bias_type=bias_type, description=f"Potential {bias_type} in formulating or prioritizing this hypothesis.",
-                assessment_stage_id=self.stage_name, severity=random.choice(["low", "medium"])
+                assessment_stage_id=self.stage_name, severity=self._rng.choice(["low", "medium"])
             ))
-        impact_score_float = random.uniform(0.2, 0.9)
-        num_tags = random.randint(1, min(2, len(self.default_disciplinary_tags_config)))
-        hypo_disciplinary_tags = set(random.sample(self.default_disciplinary_tags_config, num_tags))
-        hypo_disciplinary_tags.update(dimension_tags) # Add dimension's tags
+        impact_score_float = self._rng.uniform(0.2, 0.9)
+        num_tags = self._rng.randint(1, self._max_sampled_tags)
+        # Built as the set NodeMetadata.disciplinary_tags holds, so callers can use it without copying
+        hypo_disciplinary_tags = set(self._rng.sample(self._default_tags_tuple, num_tags))
+        hypo_disciplinary_tags |= dimension_tags # Add dimension's tags
 
         return {
             "label": base_hypothesis_text, "plan": plan_pydantic,
             "falsification_criteria": falsifiability_pydantic, "bias_flags": bias_flags_list,
-            "impact_score": impact_score_float, "disciplinary_tags": list(hypo_disciplinary_tags),
+            "impact_score": impact_score_float, "disciplinary_tags": hypo_disciplinary_tags,
         }
 
+    @staticmethod
+    def _split_on_dimension_boundaries(batch_data: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Groups rows by source dimension and packs whole groups into sub-batches of up to
+        `_HYPO_BATCH_SIZE` rows, so no dimension is written by two concurrent transactions.
+        A dimension with more rows than that forms a sub-batch of its own.
+        """
+        rows_by_dimension: Dict[str, List[Dict[str, Any]]] = {}
+        for row in batch_data:
+            rows_by_dimension.setdefault(row["dim_id_source"], []).append(row)
+
+        sub_batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        for dimension_rows in rows_by_dimension.values():
+            if current and len(current) + len(dimension_rows) > _HYPO_BATCH_SIZE:
+                sub_batches.append(current)
+                current = []
+            current.extend(dimension_rows)
+        if current:
+            sub_batches.append(current)
+        return sub_batches
+
+    async def _write_hypothesis_batch(
+        self, batch_data: List[Dict[str, Any]], semaphore: asyncio.Semaphore
+    ) -> Optional[List[Any]]:
+        """
+        Writes one sub-batch of hypothesis nodes and edges in its own transaction.
+        Errors are logged and return None, so one failed sub-batch doesn't discard the others.
+        """
+        async with semaphore:
+            try:
+                return await async_execute_query(_HYPO_BATCH_Q, {"batch_data": batch_data}, tx_type='write')
+            except Neo4jError as e:
+                logger.error(f"Neo4j error during batch hypothesis node/relationship creation: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error during batch hypothesis node/relationship creation: {e}")
+        return None
+
     async def execute(
         self, current_session_data: GoTProcessorSessionData # graph: ASRGoTGraph removed
     ) -> StageOutput:
@@ -154,6 +196,7 @@ class HypothesisStage(BaseStage):
         all_hypothesis_node_ids_created: List[str] = []
         nodes_created_count = 0
         edges_created_count = 0
+        failed_sub_batches_count = 0
         
         batch_hypothesis_node_data = []
         # Maps Neo4j hypothesis_id to its source dimension_id and the hypothesis label
@@ -161,70 +204,99 @@ class HypothesisStage(BaseStage):
 
         k_min = operational_params.get("hypotheses_per_dimension_min", self.k_min_hypotheses)
         k_max = operational_params.get("hypotheses_per_dimension_max", self.k_max_hypotheses)
-        
-        # Step 1: Collect all hypothesis data for batch node creation
+
+        # Step 1: Fetch every dimension in one round-trip instead of one read per dimension
+        dimensions_by_id: Dict[str, Any] = {}
+        try:
+            dim_records = await async_execute_query(_FETCH_DIMS_Q, {"dimension_ids": dimension_node_ids}, tx_type="read")
+            dimensions_by_id = {record["dim_id"]: record for record in dim_records}
+        except Neo4jError as e:
+            logger.error(f"Neo4j error fetching dimensions {dimension_node_ids}: {e}. Skipping.")
+        except Exception as e:
+            logger.error(f"Unexpected error fetching dimensions {dimension_node_ids}: {e}. Skipping.")
+
+        # Step 2: Collect all hypothesis data, with its GENERATES_HYPOTHESIS edge, for one batch write
         for dim_id in dimension_node_ids:
+            dim_record = dimensions_by_id.get(dim_id)
+            if dim_record is None:
+                logger.warning(f"Dimension node {dim_id} not found. Skipping hypothesis generation for it.")
+                continue
             try:
-                fetch_dim_query = "MATCH (d:Node {id: $dimension_id}) RETURN properties(d) as props"
-                dim_records = await execute_query(fetch_dim_query, {"dimension_id": dim_id}, tx_type="read")
-                if not dim_records or not dim_records[0].get("props"):
-                    logger.warning(f"Dimension node {dim_id} not found. Skipping hypothesis generation for it.")
-                    continue
-                
-                dim_props = dim_records[0]["props"]
-                dimension_label_for_hypo = dim_props.get("label", "Unknown Dimension")
-                dimension_tags_for_hypo = set(dim_props.get("metadata_disciplinary_tags", []))
-                dimension_layer_for_hypo = dim_props.get("metadata_layer_id", self.default_params.initial_layer)
+                dimension_label_for_hypo = dim_record.get("label") or "Unknown Dimension"
+                dimension_tags_for_hypo = set(dim_record.get("tags") or ())
+                dimension_layer_for_hypo = dim_record.get("layer_id") or self.default_params.initial_layer
 
-                k_hypotheses_to_generate = random.randint(k_min, k_max)
+                k_hypotheses_to_generate = self._rng.randint(k_min, k_max)
                 logger.debug(f"Preparing {k_hypotheses_to_generate} hypotheses for dimension: '{dimension_label_for_hypo}' (ID: {dim_id})")
+                # Categorical draws for the whole dimension in one call each, rather than per hypothesis
+                plan_types = self._rng.choices(self.default_plan_types_config, k=k_hypotheses_to_generate)
+                required_resources = self._rng.choices(_PLAN_RESOURCES, k=k_hypotheses_to_generate)
+                falsification_metrics = self._rng.choices(_FALSIFICATION_METRICS, k=k_hypotheses_to_generate)
+
+                # The hypothesis IDs are generated client-side, so each edge from the dimension can be
+                # prepared now and written by the same query as its node. Only the edge's id and
+                # description differ within a dimension, so its properties are flattened once here.
+                edge_props_template = prepare_edge_properties_for_neo4j(Edge.model_construct(
+                    id="", source_id=dim_id, target_id="", type=_GEN_HYPO_EDGE, confidence=0.9,
+                    metadata=EdgeMetadata.model_construct(),
+                ))
+                edge_description_suffix = f"' generated for dimension '{dimension_label_for_hypo}'."
+                # IDs differ only by index within a dimension, so the prefixes are formatted once
+                hypo_id_prefix = f"hypo_{dim_id}_{current_session_data.session_id}_"
+                edge_id_prefix = f"edge_{dim_id}_genhyp_"
 
                 for i in range(k_hypotheses_to_generate):
                     hypo_content = await self._generate_hypothesis_content(
-                        dimension_label_for_hypo, dimension_tags_for_hypo, i, initial_query
+                        dimension_label_for_hypo, dimension_tags_for_hypo, i, initial_query,
+                        plan_types[i], required_resources[i], falsification_metrics[i],
                     )
-                    hypo_id_neo4j = f"hypo_{dim_id}_{current_session_data.session_id}_{i}"
+                    hypo_id_neo4j = hypo_id_prefix + str(i)
 
-                    hypo_metadata = NodeMetadata(
+                    # Every value below is built in-stage with the field's own type, and the models
+                    # are only flattened for Neo4j, so model_construct() skips re-validating them
+                    hypo_metadata = NodeMetadata.model_construct(
                         description=f"A hypothesis related to dimension: '{dimension_label_for_hypo}'.",
                         source_description="HypothesisStage (P1.3)",
-                        epistemic_status=EpistemicStatus.HYPOTHESIS,
-                        disciplinary_tags=list(hypo_content["disciplinary_tags"]),
+                        epistemic_status=_EPI_HYPO,
+                        disciplinary_tags=hypo_content["disciplinary_tags"],
                         falsification_criteria=hypo_content["falsification_criteria"],
                         bias_flags=hypo_content["bias_flags"],
                         impact_score=hypo_content["impact_score"],
                         plan=hypo_content["plan"],
                         layer_id=operational_params.get("hypothesis_layer", dimension_layer_for_hypo),
                     )
-                    hypothesis_node_pydantic = Node(
-                        id=hypo_id_neo4j, label=hypo_content["label"], type=NodeType.HYPOTHESIS,
-                        confidence=ConfidenceVector.from_list(self.hypothesis_confidence_values),
+                    hypothesis_node_pydantic = Node.model_construct(
+                        id=hypo_id_neo4j, label=hypo_content["label"], type=_HYPO_NODE_TYPE,
+                        confidence=self._hypothesis_confidence,
                         metadata=hypo_metadata
                     )
-                    hyp_props_for_neo4j = self._prepare_node_properties_for_neo4j(hypothesis_node_pydantic)
-                    
+                    hyp_props_for_neo4j = prepare_node_properties_for_neo4j(hypothesis_node_pydantic)
+                    edge_props = edge_props_template.copy()
+                    edge_props["id"] = edge_id_prefix + hypo_id_neo4j
+                    edge_props["metadata_description"] = "Hypothesis '" + hypo_content["label"] + edge_description_suffix
+
                     batch_hypothesis_node_data.append({
                         "props": hyp_props_for_neo4j,
-                        "type_label_value": NodeType.HYPOTHESIS.value,
                         "dim_id_source": dim_id, # To link back for relationship creation
-                        "hypo_label_original": hypo_content["label"] # For logging/mapping
+                        "hypo_label_original": hypo_content["label"], # For logging/mapping
+                        "edge_props": edge_props,
                     })
-            except Neo4jError as e:
-                logger.error(f"Neo4j error fetching dimension {dim_id}: {e}. Skipping.")
             except Exception as e:
                 logger.error(f"Unexpected error preparing hypotheses for dimension {dim_id}: {e}. Skipping.")
 
-        # Step 2: Execute batch hypothesis node creation
+        # Step 3: Write hypothesis nodes and their relationships in bounded sub-batches
         if batch_hypothesis_node_data:
-            try:
-                batch_node_query = """
-                UNWIND $batch_data AS item
-                MERGE (h:Node {id: item.props.id}) SET h += item.props
-                WITH h, item.type_label_value AS typeLabelValue CALL apoc.create.addLabels(h, [typeLabelValue]) YIELD node
-                RETURN node.id AS created_hyp_id, item.dim_id_source AS dim_id_source, item.hypo_label_original AS hypo_label
-                """
-                results_nodes = await execute_query(batch_node_query, {"batch_data": batch_hypothesis_node_data}, tx_type='write')
-                
+            await ensure_schema() # MERGE on :Node(id) needs the uniqueness constraint to avoid label scans
+            semaphore = asyncio.Semaphore(_HYPO_WRITE_CONCURRENCY)
+            sub_batch_results = await asyncio.gather(*(
+                self._write_hypothesis_batch(sub_batch, semaphore)
+                for sub_batch in self._split_on_dimension_boundaries(batch_hypothesis_node_data)
+            ))
+
+            for results_nodes in sub_batch_results:
+                if results_nodes is None:
+                    failed_sub_batches_count += 1
+                    continue
                 for record in results_nodes:
                     created_hyp_id = record["created_hyp_id"]
                     dim_id_source = record["dim_id_source"]
@@ -232,68 +304,16 @@ class HypothesisStage(BaseStage):
                     
                     all_hypothesis_node_ids_created.append(created_hyp_id)
                     nodes_created_count += 1
+                    edges_created_count += 1 # One GENERATES_HYPOTHESIS edge per returned row
                     created_hypotheses_map[created_hyp_id] = {"dim_id": dim_id_source, "label": hypo_label}
                     logger.debug(f"Batch created/merged hypothesis node '{hypo_label}' (ID: {created_hyp_id}) for dimension {dim_id_source}.")
-            except Neo4jError as e:
-                logger.error(f"Neo4j error during batch hypothesis node creation: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error during batch hypothesis node creation: {e}")
-
-        # Step 3: Collect and batch relationship creation
-        batch_relationship_data = []
-        if created_hypotheses_map:
-            for created_hyp_id, hypo_data_map in created_hypotheses_map.items():
-                dim_id_for_rel = hypo_data_map["dim_id"]
-                hypo_label_for_rel = hypo_data_map["label"]
-                
-                # Need dimension label for edge description - fetch it again or store it earlier if needed
-                # For simplicity, we'll use a generic description or try to retrieve it if it was stored with dim_id
-                # This part might need adjustment if dim_label is not easily accessible here.
-                # Assuming dim_id_for_rel can be used to fetch its label if necessary, or we use what we have.
-                # For now, using a placeholder from the hypo_label_for_rel.
-                dim_label_placeholder = f"Dimension for '{hypo_label_for_rel[:20]}...'"
-
-
-                edge_id = f"edge_{dim_id_for_rel}_genhyp_{created_hyp_id}"
-                edge_pydantic = Edge(
-                    id=edge_id, source_id=dim_id_for_rel, target_id=created_hyp_id,
-                    type=EdgeType.GENERATES_HYPOTHESIS, confidence=0.9,
-                    metadata=EdgeMetadata(description=f"Hypothesis '{hypo_label_for_rel}' generated for dimension '{dim_label_placeholder}'.")
-                )
-                edge_props_for_neo4j = self._prepare_edge_properties_for_neo4j(edge_pydantic)
-                batch_relationship_data.append({
-                    "dim_id": dim_id_for_rel, 
-                    "hyp_id": created_hyp_id, 
-                    "props": edge_props_for_neo4j
-                })
-
-        # Step 4: Execute batch relationship creation
-        if batch_relationship_data:
-            try:
-                batch_rel_query = """
-                UNWIND $batch_rels AS rel_detail
-                MATCH (dim:Node {id: rel_detail.dim_id})
-                MATCH (hyp:Node {id: rel_detail.hyp_id})
-                MERGE (dim)-[r:GENERATES_HYPOTHESIS {id: rel_detail.props.id}]->(hyp)
-                SET r += rel_detail.props
-                RETURN count(r) AS total_rels_created
-                """
-                result_rels = await execute_query(batch_rel_query, {"batch_rels": batch_relationship_data}, tx_type='write')
-                if result_rels and result_rels[0].get("total_rels_created") is not None:
-                    edges_created_count = result_rels[0]["total_rels_created"]
-                    logger.debug(f"Batch created {edges_created_count} GENERATES_HYPOTHESIS relationships.")
-                else:
-                    logger.error("Batch GENERATES_HYPOTHESIS relationship creation query did not return expected count.")
-            except Neo4jError as e:
-                logger.error(f"Neo4j error during batch GENERATES_HYPOTHESIS relationship creation: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error during batch GENERATES_HYPOTHESIS relationship creation: {e}")
 
         summary = f"Generated {nodes_created_count} hypotheses in Neo4j across {len(dimension_node_ids)} dimensions."
         metrics = {
             "hypotheses_created_in_neo4j": nodes_created_count,
             "relationships_created_in_neo4j": edges_created_count,
             "avg_hypotheses_per_dimension": nodes_created_count / len(dimension_node_ids) if dimension_node_ids else 0,
+            "failed_hypothesis_sub_batches": failed_sub_batches_count,
         }
         # Ensure hypotheses_results key is populated if other stages expect it
         hypotheses_results_for_context = [
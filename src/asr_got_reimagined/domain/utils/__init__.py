@@ -6,8 +6,13 @@ from .graph_analysis_helpers import (  # Placeholder for future graph algorithms
 )
 from .math_helpers import (
     bayesian_update_confidence,
+    bayesian_update_confidence_batch,
     calculate_information_gain,  # Placeholder
 )
+from .neo4j_helpers import (
+    prepare_edge_properties_for_neo4j,
+    prepare_node_properties_for_neo4j,
+)
 from .metadata_helpers import (  # Placeholder for complex metadata operations
     assess_falsifiability_score,
     calculate_semantic_similarity,  # Placeholder
@@ -17,9 +22,12 @@ from .metadata_helpers import (  # Placeholder for complex metadata operations
 __all__ = [
     "assess_falsifiability_score",
     "bayesian_update_confidence",
+    "bayesian_update_confidence_batch",
     "calculate_information_gain",
     "calculate_node_centrality",
     "calculate_semantic_similarity",
     "detect_communities",
     "detect_potential_biases",
+    "prepare_edge_properties_for_neo4j",
+    "prepare_node_properties_for_neo4j",
 ]
@@ -9,23 +9,12 @@ from src.asr_got_reimagined.domain.models.graph_elements import (
 )
 
 
-def bayesian_update_confidence(
-    prior_confidence: ConfidenceVector,
-    evidence_strength: CertaintyScore,  # A single score representing how strong this piece of evidence is
-    evidence_supports_hypothesis: bool,  # True if supportive, False if contradictory
-    statistical_power: Optional[StatisticalPower] = None,  # P1.26
-    edge_type: Optional[EdgeType] = None,  # P1.10, P1.24, P1.25 for context
-) -> ConfidenceVector:
-    """
-    Performs a simplified Bayesian-inspired update on a confidence vector based on new evidence.
-    
-    The update adjusts each component of the confidence vector toward 1.0 if the evidence supports the hypothesis, or toward 0.0 if it contradicts, scaled by a weight derived from evidence strength, statistical power, and edge type. Returns a new confidence vector reflecting the updated values.
-    """
-    # This is a highly simplified placeholder. True Bayesian updates involve likelihoods, priors, etc.
-    # and updating probability distributions, not just scores.
-    # P1.14 mentions "probability distributions" for confidence components.
-
-    # For now, we'll do a weighted adjustment.
+def _evidence_weight(
+    evidence_strength: CertaintyScore,
+    statistical_power: Optional[StatisticalPower],
+    edge_type: Optional[EdgeType],
+) -> float:
+    """Weight (0-1) with which one piece of evidence pulls a confidence vector toward its target."""
     # Weight factor considers evidence strength and statistical power.
     power_multiplier = (
         statistical_power.value if statistical_power else 0.5
@@ -44,7 +33,27 @@ def bayesian_update_confidence(
             pass
 
     weight *= edge_type_factor
-    weight = max(0, min(weight, 1.0))  # Clamp weight
+    return max(0, min(weight, 1.0))  # Clamp weight
+
+
+def bayesian_update_confidence(
+    prior_confidence: ConfidenceVector,
+    evidence_strength: CertaintyScore,  # A single score representing how strong this piece of evidence is
+    evidence_supports_hypothesis: bool,  # True if supportive, False if contradictory
+    statistical_power: Optional[StatisticalPower] = None,  # P1.26
+    edge_type: Optional[EdgeType] = None,  # P1.10, P1.24, P1.25 for context
+) -> ConfidenceVector:
+    """
+    Performs a simplified Bayesian-inspired update on a confidence vector based on new evidence.
+    
+    The update adjusts each component of the confidence vector toward 1.0 if the evidence supports the hypothesis, or toward 0.0 if it contradicts, scaled by a weight derived from evidence strength, statistical power, and edge type. Returns a new confidence vector reflecting the updated values.
+    """
+    # This is a highly simplified placeholder. True Bayesian updates involve likelihoods, priors, etc.
+    # and updating probability distributions, not just scores.
+    # P1.14 mentions "probability distributions" for confidence components.
+
+    # For now, we'll do a weighted adjustment.
+    weight = _evidence_weight(evidence_strength, statistical_power, edge_type)
 
     new_confidence_values = prior_confidence.to_list()
     target_value = 1.0 if evidence_supports_hypothesis else 0.0
@@ -60,7 +69,35 @@ def bayesian_update_confidence(
 
     logger.debug(
         f"Bayesian update: Prior {prior_confidence.to_list()}, Evidence Strength {evidence_strength}, "
-        f"Supports: {evidence_supports_hypothesis}, Power: {power_multiplier}, Edge: {edge_type} "
+        f"Supports: {evidence_supports_hypothesis}, Power: {statistical_power.value if statistical_power else None}, Edge: {edge_type} "
+        f"-> New {new_confidence_values}"
+    )
+    return ConfidenceVector.from_list(new_confidence_values)
+
+
+def bayesian_update_confidence_batch(
+    prior_confidence: ConfidenceVector,
+    evidence: list[tuple[CertaintyScore, bool, Optional[StatisticalPower], Optional[EdgeType]]],
+) -> ConfidenceVector:
+    """
+    Applies several pieces of evidence to a confidence vector in one call.
+
+    `evidence` holds (strength, supports_hypothesis, statistical_power, edge_type) tuples. The result
+    equals chaining `bayesian_update_confidence` over them in order, each update starting from the
+    previous posterior, but the weights are computed once and no intermediate vectors are built.
+    """
+    steps = [
+        (_evidence_weight(strength, power, edge_type), 1.0 if supports else 0.0)
+        for strength, supports, power, edge_type in evidence
+    ]
+    new_confidence_values = prior_confidence.to_list()
+    for i, current_val in enumerate(new_confidence_values):
+        for weight, target_value in steps:
+            current_val = max(0.0, min(1.0, current_val + weight * (target_value - current_val)))
+        new_confidence_values[i] = current_val
+
+    logger.debug(
+        f"Batched Bayesian update: Prior {prior_confidence.to_list()}, {len(steps)} evidence pieces "
         f"-> New {new_confidence_values}"
     )
     return ConfidenceVector.from_list(new_confidence_values)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Optional
 
 from loguru import logger
@@ -33,6 +34,12 @@ def detect_potential_biases() -> list[
     return []
 
 
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset[str]:
+    """Lower-cased word set of `text`; cached since the same labels are compared repeatedly."""
+    return frozenset(text.lower().split())
+
+
 def calculate_semantic_similarity(text1: str, text2: str) -> float:
     """P1.8: Semantic similarity for IBN creation."""
     logger.warning(
@@ -42,8 +49,9 @@ def calculate_semantic_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     # Simple common word overlap for now
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
+    words1 = _word_set(text1)
+    words2 = _word_set(text2)
     if not words1 or not words2:
         return 0.0
-    return len(words1.intersection(words2)) / len(words1.union(words2))
+    common = len(words1 & words2)
+    return common / (len(words1) + len(words2) - common)
@@ -0,0 +1,243 @@
+"""
+Helpers for turning graph element models into flat Neo4j property maps.
+
+Neo4j properties can only hold primitives and homogeneous lists of primitives, so
+the nested `ConfidenceVector` and `NodeMetadata`/`EdgeMetadata` models are flattened
+into prefixed keys (`confidence_*`, `metadata_*`), with nested models stored as JSON
+strings under a `_json` suffix.
+"""
+
+import json
+import sys
+import types
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from loguru import logger  # type: ignore
+from pydantic import BaseModel, TypeAdapter
+
+from asr_got_reimagined.domain.models.common import ConfidenceVector
+from asr_got_reimagined.domain.models.graph_elements import Edge, Node
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib encoder produces the same output
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encodes the non-JSON types found in model dumps, identically for both encoders."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    """Serializes `value` to a JSON string (Neo4j properties need `str`, not `bytes`)."""
+    if orjson is not None:
+        # orjson.JSONEncodeError subclasses TypeError, so callers' handlers still apply
+        return orjson.dumps(value, default=_json_default).decode()
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+# Property names are fixed by the model schema, so build them once at import time. They are
+# interned so every props dict shares the same key objects and lookups hit the identity check.
+_CV_FIELDS = tuple(ConfidenceVector.model_fields)
+_CV_PREFIXED = tuple(sys.intern(f"confidence_{k}") for k in _CV_FIELDS)
+
+
+class _FieldPlan(NamedTuple):
+    """How one metadata field is written: its Neo4j property names and emit handler."""
+    name: str
+    key: str
+    json_key: str
+    str_key: str
+    emit: Callable[[Dict[str, Any], "_FieldPlan", Any], None]
+    # For collections of sub-models: serializes the whole collection to JSON in pydantic-core
+    adapter: Optional[TypeAdapter] = None
+
+
+def _emit_scalar(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    props[field.key] = value
+
+
+def _emit_datetime(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    props[field.key] = value.isoformat()
+
+
+def _emit_enum(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    props[field.key] = value.value
+
+
+def _emit_list(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    """Stores primitive lists/sets natively and anything else as a JSON string."""
+    if all(isinstance(item, (str, int, float, bool)) for item in value):
+        # Sets are sorted so equal sets are always stored as equal lists; a set mixing
+        # unorderable types (e.g. str and int) is stored in iteration order instead
+        if isinstance(value, set):
+            try:
+                props[field.key] = sorted(value)
+                return
+            except TypeError:
+                pass
+        props[field.key] = list(value)
+        return
+    try:
+        if field.adapter is not None:
+            props[field.json_key] = field.adapter.dump_json(value).decode()
+        else:
+            items_as_dicts = [item.model_dump() if isinstance(item, BaseModel) else item for item in value]
+            props[field.json_key] = _dumps(items_as_dicts)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Could not serialize list/set metadata field {field.name} to JSON: {e}")
+        props[field.str_key] = str(value)
+
+
+def _emit_model(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    """Stores a sub-model (or, for edges, any collection) as a JSON string."""
+    try:
+        if isinstance(value, BaseModel):
+            # pydantic-core writes the JSON directly, without an intermediate model_dump() dict
+            props[field.json_key] = value.model_dump_json()
+        elif field.adapter is not None:
+            props[field.json_key] = field.adapter.dump_json(value).decode()
+        else:
+            props[field.json_key] = _dumps(value)
+    except (TypeError, ValueError) as e:  # PydanticSerializationError is a ValueError
+        logger.warning(f"Could not serialize metadata field {field.name} to JSON: {e}")
+        props[field.str_key] = str(value)
+
+
+# Exact-type lookup for the common runtime types; subclasses (enums, models) miss and
+# fall through to the isinstance chain in _emit_any
+_TYPE_HANDLERS: Dict[type, Callable[[Dict[str, Any], _FieldPlan, Any], None]] = {
+    str: _emit_scalar, int: _emit_scalar, float: _emit_scalar, bool: _emit_scalar,
+    datetime: _emit_datetime, list: _emit_list, set: _emit_list,
+}
+
+
+def _emit_any(props: Dict[str, Any], field: _FieldPlan, value: Any) -> None:
+    """Fallback for fields whose annotation doesn't pin down a handler: dispatch on the value."""
+    handler = _TYPE_HANDLERS.get(type(value))
+    if handler is not None:
+        handler(props, field, value)
+    elif isinstance(value, datetime):
+        _emit_datetime(props, field, value)
+    elif isinstance(value, Enum):
+        _emit_enum(props, field, value)
+    elif isinstance(value, (list, set)):
+        _emit_list(props, field, value)
+    elif isinstance(value, BaseModel):
+        _emit_model(props, field, value)
+    else:
+        _emit_scalar(props, field, value)
+
+
+def _handler_for(annotation: Any, json_collections: bool) -> Callable[[Dict[str, Any], _FieldPlan, Any], None]:
+    """Picks the emit handler for a field annotation; `json_collections` stores every collection as JSON."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _handler_for(get_args(annotation)[0], json_collections)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _handler_for(args[0], json_collections) if len(args) == 1 else _emit_any
+    if origin in (list, set, frozenset):
+        return _emit_model if json_collections else _emit_list
+    if origin is dict or annotation is dict:
+        return _emit_model if json_collections else _emit_any
+    if isinstance(annotation, type):
+        if issubclass(annotation, datetime):
+            return _emit_datetime
+        if issubclass(annotation, Enum):  # before str: str-valued enums subclass str
+            return _emit_enum
+        if issubclass(annotation, BaseModel):
+            return _emit_model
+        if issubclass(annotation, (str, int, float, bool)):
+            return _emit_scalar
+    return _emit_any
+
+
+def _model_collection_adapter(annotation: Any) -> Optional[TypeAdapter]:
+    """Returns a TypeAdapter for `list[Model]`/`set[Model]` annotations (optionally Optional)."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    item_args = get_args(annotation)
+    if (get_origin(annotation) in (list, set, frozenset) and len(item_args) == 1
+            and isinstance(item_args[0], type) and issubclass(item_args[0], BaseModel)):
+        return TypeAdapter(annotation)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_meta_plan(model_cls: type, json_collections: bool = False) -> Tuple[_FieldPlan, ...]:
+    """Builds (once per metadata class) the property names and handler for each field."""
+    return tuple(
+        _FieldPlan(
+            name,
+            sys.intern(f"metadata_{name}"), sys.intern(f"metadata_{name}_json"), sys.intern(f"metadata_{name}_str"),
+            _handler_for(field_info.annotation, json_collections),
+            _model_collection_adapter(field_info.annotation),
+        )
+        for name, field_info in model_cls.model_fields.items()
+    )
+
+
+def prepare_node_properties_for_neo4j(node_pydantic: Optional[Node]) -> Dict[str, Any]:
+    """Converts a Node Pydantic model into a flat dictionary for Neo4j."""
+    if node_pydantic is None:
+        return {}
+    props = {"id": node_pydantic.id, "label": node_pydantic.label}
+    cv = node_pydantic.confidence
+    if cv is not None:
+        for key, attr in zip(_CV_PREFIXED, _CV_FIELDS, strict=True):
+            cv_val = getattr(cv, attr)
+            if cv_val is not None:
+                props[key] = cv_val
+    # Metadata values are read straight from the model's __dict__; model_dump() would rebuild
+    # every nested model as a dict first. Sub-models are only dumped when stored as JSON.
+    metadata = node_pydantic.metadata
+    if metadata:
+        meta_values = metadata.__dict__
+        for field in _get_meta_plan(type(metadata)):
+            meta_val = meta_values.get(field.name)
+            if meta_val is not None:
+                field.emit(props, field, meta_val)
+    return props
+
+
+def prepare_edge_properties_for_neo4j(edge_pydantic: Optional[Edge]) -> Dict[str, Any]:
+    """Converts an Edge Pydantic model into a flat dictionary for Neo4j."""
+    if edge_pydantic is None:
+        return {}
+    props = {"id": edge_pydantic.id}  # Type is handled by relationship type in query
+    if hasattr(edge_pydantic, 'confidence') and edge_pydantic.confidence is not None:
+        props["confidence"] = edge_pydantic.confidence
+    metadata = edge_pydantic.metadata
+    if metadata:
+        meta_values = metadata.__dict__
+        # Edges store every collection as JSON, primitive lists included
+        for field in _get_meta_plan(type(metadata), True):
+            meta_val = meta_values.get(field.name)
+            if meta_val is not None:
+                field.emit(props, field, meta_val)
+    return props
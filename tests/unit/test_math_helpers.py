@@ -0,0 +1,69 @@
+"""
+Unit tests for the batched confidence update in domain.utils.math_helpers.
+"""
+import pytest
+
+from asr_got_reimagined.domain.models.common import ConfidenceVector
+from asr_got_reimagined.domain.models.graph_elements import EdgeType, StatisticalPower
+from asr_got_reimagined.domain.utils.math_helpers import (
+    bayesian_update_confidence,
+    bayesian_update_confidence_batch,
+)
+
+PRIOR = ConfidenceVector.from_list([0.2, 0.4, 0.6, 0.8])
+
+
+def _chained_updates(prior, evidence):
+    """Applies `bayesian_update_confidence` once per evidence tuple, each starting from the last result."""
+    confidence = prior
+    for strength, supports, power, edge_type in evidence:
+        confidence = bayesian_update_confidence(
+            prior_confidence=confidence,
+            evidence_strength=strength,
+            evidence_supports_hypothesis=supports,
+            statistical_power=power,
+            edge_type=edge_type,
+        )
+    return confidence
+
+
+def test_batch_without_evidence_returns_prior():
+    result = bayesian_update_confidence_batch(PRIOR, [])
+
+    assert result.to_list() == PRIOR.to_list()
+
+
+@pytest.mark.parametrize(
+    "evidence",
+    [
+        [(0.7, True, StatisticalPower(value=0.9), EdgeType.SUPPORTIVE)],
+        [
+            (0.7, True, StatisticalPower(value=0.9), EdgeType.SUPPORTIVE),
+            (0.4, False, None, EdgeType.CONTRADICTORY),
+            (0.6, True, StatisticalPower(value=0.5), EdgeType.CORRELATIVE),
+            (0.3, True, None, None),
+        ],
+    ],
+)
+def test_batch_matches_chained_single_updates(evidence):
+    expected = _chained_updates(PRIOR, evidence)
+
+    result = bayesian_update_confidence_batch(PRIOR, evidence)
+
+    assert result.to_list() == pytest.approx(expected.to_list())
+
+
+def test_batch_clamps_like_chained_single_updates():
+    # Full strength and power on a supportive edge gives a weight above 1.0, which is clamped,
+    # so the first piece moves every component all the way to its target
+    evidence = [
+        (1.0, True, StatisticalPower(value=1.0), EdgeType.SUPPORTIVE),
+        (1.0, False, StatisticalPower(value=1.0), EdgeType.CAUSES),
+    ]
+
+    supported = bayesian_update_confidence_batch(PRIOR, evidence[:1])
+    result = bayesian_update_confidence_batch(PRIOR, evidence)
+
+    assert supported.to_list() == pytest.approx([1.0, 1.0, 1.0, 1.0])
+    assert result.to_list() == pytest.approx([0.0, 0.0, 0.0, 0.0])
+    assert result.to_list() == pytest.approx(_chained_updates(PRIOR, evidence).to_list())
@@ -0,0 +1,205 @@
+"""
+Pins the shared Neo4j property flatteners in domain.utils.neo4j_helpers against the
+per-stage flatteners they replaced, which are reproduced below as the reference.
+"""
+import json
+from datetime import datetime
+from enum import Enum
+
+from asr_got_reimagined.domain.models.common import ConfidenceVector, EpistemicStatus
+from asr_got_reimagined.domain.models.graph_elements import (
+    BiasFlag,
+    CausalMetadata,
+    Edge,
+    EdgeMetadata,
+    EdgeType,
+    Node,
+    NodeMetadata,
+    NodeType,
+    Plan,
+    RevisionRecord,
+    StatisticalPower,
+    TemporalMetadata,
+)
+from asr_got_reimagined.domain.utils.neo4j_helpers import (
+    prepare_edge_properties_for_neo4j,
+    prepare_node_properties_for_neo4j,
+)
+
+CREATED_AT = datetime(2024, 1, 2, 3, 4, 5)
+UPDATED_AT = datetime(2024, 1, 3, 4, 5, 6)
+
+
+# --- Reference: the flatteners stages 2 and 3 carried before they were shared ---
+def _reference_node_properties(node_pydantic):
+    if node_pydantic is None:
+        return {}
+    props = {"id": node_pydantic.id, "label": node_pydantic.label}
+    if node_pydantic.confidence:
+        for cv_field, cv_val in node_pydantic.confidence.model_dump().items():
+            if cv_val is not None:
+                props[f"confidence_{cv_field}"] = cv_val
+    if node_pydantic.metadata:
+        for meta_field, meta_val in node_pydantic.metadata.model_dump().items():
+            if meta_val is None:
+                continue
+            if isinstance(meta_val, datetime):
+                props[f"metadata_{meta_field}"] = meta_val.isoformat()
+            elif isinstance(meta_val, Enum):
+                props[f"metadata_{meta_field}"] = meta_val.value
+            elif isinstance(meta_val, (list, set)):
+                if all(isinstance(item, (str, int, float, bool)) for item in meta_val):
+                    props[f"metadata_{meta_field}"] = list(meta_val)
+                else:
+                    try:
+                        items_as_dicts = [item.model_dump() if hasattr(item, 'model_dump') else item for item in meta_val]
+                        props[f"metadata_{meta_field}_json"] = json.dumps(items_as_dicts)
+                    except TypeError:
+                        props[f"metadata_{meta_field}_str"] = str(meta_val)
+            elif hasattr(meta_val, 'model_dump'):
+                try:
+                    props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump())
+                except TypeError:
+                    props[f"metadata_{meta_field}_str"] = str(meta_val)
+            else:
+                props[f"metadata_{meta_field}"] = meta_val
+    return {k: v for k, v in props.items() if v is not None}
+
+
+def _reference_edge_properties(edge_pydantic):
+    if edge_pydantic is None:
+        return {}
+    props = {"id": edge_pydantic.id}
+    if hasattr(edge_pydantic, 'confidence') and edge_pydantic.confidence is not None:
+        props["confidence"] = edge_pydantic.confidence
+    if edge_pydantic.metadata:
+        for meta_field, meta_val in edge_pydantic.metadata.model_dump().items():
+            if meta_val is None:
+                continue
+            if isinstance(meta_val, datetime):
+                props[f"metadata_{meta_field}"] = meta_val.isoformat()
+            elif isinstance(meta_val, Enum):
+                props[f"metadata_{meta_field}"] = meta_val.value
+            elif isinstance(meta_val, (list, set, dict)) or hasattr(meta_val, 'model_dump'):
+                try:
+                    props[f"metadata_{meta_field}_json"] = json.dumps(meta_val.model_dump() if hasattr(meta_val, 'model_dump') else meta_val)
+                except TypeError:
+                    props[f"metadata_{meta_field}_str"] = str(meta_val)
+            else:
+                props[f"metadata_{meta_field}"] = meta_val
+    return {k: v for k, v in props.items() if v is not None}
+
+
+def _make_node(**metadata_fields):
+    return Node(
+        id="hypo_1", label="Hypothesis 1", type=NodeType.HYPOTHESIS,
+        confidence=ConfidenceVector.from_list([0.1, 0.2, 0.3, 0.4]),
+        metadata=NodeMetadata(created_at=CREATED_AT, updated_at=UPDATED_AT, **metadata_fields),
+    )
+
+
+def _make_edge(**metadata_fields):
+    return Edge(
+        id="edge_1", source_id="dim_1", target_id="hypo_1", type=EdgeType.GENERATES_HYPOTHESIS, confidence=0.9,
+        metadata=EdgeMetadata(created_at=CREATED_AT, updated_at=UPDATED_AT, **metadata_fields),
+    )
+
+
+def test_node_properties_match_reference():
+    node = _make_node(
+        description="A hypothesis.",
+        epistemic_status=EpistemicStatus.HYPOTHESIS,
+        disciplinary_tags={"physics", "biology", "chemistry"},
+        bias_flags=[BiasFlag(bias_type="Confirmation Bias", severity="medium")],
+        impact_score=0.7,
+        layer_id="hypothesis_layer",
+    )
+
+    expected = _reference_node_properties(node)
+    props = prepare_node_properties_for_neo4j(node)
+
+    # Sets are now stored sorted; the reference kept set iteration order
+    assert props["metadata_disciplinary_tags"] == sorted(expected.pop("metadata_disciplinary_tags"))
+    del props["metadata_disciplinary_tags"]
+    # Same JSON content, but the shared flattener writes it without whitespace
+    assert json.loads(props.pop("metadata_bias_flags_json")) == json.loads(expected.pop("metadata_bias_flags_json"))
+    assert props == expected
+    assert props["metadata_epistemic_status"] == "hypothesis"
+    assert props["metadata_created_at"] == CREATED_AT.isoformat()
+
+
+def test_node_sub_models_are_stored_as_json():
+    plan = Plan(type="experiment", description="Run it.", required_resources=["lab"])
+    power = StatisticalPower(value=0.9, sample_size=120)
+    node = _make_node(plan=plan, statistical_power=power)
+
+    expected = _reference_node_properties(node)
+    props = prepare_node_properties_for_neo4j(node)
+
+    # The reference left sub-models as dicts, which Neo4j cannot store as a property;
+    # they are now written as JSON strings holding the same content
+    assert "metadata_plan" not in props and "metadata_statistical_power" not in props
+    assert json.loads(props["metadata_plan_json"]) == expected["metadata_plan"]
+    assert json.loads(props["metadata_statistical_power_json"]) == expected["metadata_statistical_power"]
+
+
+def test_node_sub_model_lists_with_datetimes_are_stored_as_json():
+    revision = RevisionRecord(
+        timestamp=CREATED_AT, user_or_process="HypothesisStage", action="created", changes_made={"label": "new"},
+    )
+    node = _make_node(revision_history=[revision])
+
+    expected = _reference_node_properties(node)
+    props = prepare_node_properties_for_neo4j(node)
+
+    # json.dumps could not encode the nested datetime, so the reference fell back to str()
+    assert "metadata_revision_history_str" in expected
+    assert "metadata_revision_history_str" not in props
+    assert json.loads(props["metadata_revision_history_json"]) == [{
+        "timestamp": CREATED_AT.isoformat(), "user_or_process": "HypothesisStage", "action": "created",
+        "changes_made": {"label": "new"}, "reason": None,
+    }]
+
+
+def test_node_empty_collections_match_reference():
+    node = _make_node()
+
+    expected = _reference_node_properties(node)
+    props = prepare_node_properties_for_neo4j(node)
+
+    assert props == expected
+    assert props["metadata_disciplinary_tags"] == []
+    assert props["metadata_bias_flags"] == []
+
+
+def test_edge_properties_match_reference():
+    causal = CausalMetadata(strength=0.6, mechanism_description="mechanism", confounders_identified=["age"])
+    edge = _make_edge(description="Generated hypothesis.", weight=0.5, causal_metadata=causal)
+
+    expected = _reference_edge_properties(edge)
+    props = prepare_edge_properties_for_neo4j(edge)
+
+    assert json.loads(props.pop("metadata_causal_metadata_json")) == json.loads(expected.pop("metadata_causal_metadata_json"))
+    assert props == expected
+    assert props["metadata_attribution_json"] == "[]"
+    assert props["metadata_updated_at"] == UPDATED_AT.isoformat()
+
+
+def test_edge_sub_models_with_datetimes_are_stored_as_json():
+    temporal = TemporalMetadata(start_time=CREATED_AT, end_time=UPDATED_AT, pattern_type="linear")
+    edge = _make_edge(temporal_metadata=temporal)
+
+    expected = _reference_edge_properties(edge)
+    props = prepare_edge_properties_for_neo4j(edge)
+
+    assert "metadata_temporal_metadata_str" in expected
+    assert "metadata_temporal_metadata_str" not in props
+    assert json.loads(props["metadata_temporal_metadata_json"]) == {
+        "start_time": CREATED_AT.isoformat(), "end_time": UPDATED_AT.isoformat(),
+        "duration_seconds": None, "delay_seconds": None, "pattern_type": "linear",
+    }
+
+
+def test_missing_elements_flatten_to_empty_dicts():
+    assert prepare_node_properties_for_neo4j(None) == _reference_node_properties(None) == {}
+    assert prepare_edge_properties_for_neo4j(None) == _reference_edge_properties(None) == {}
@@ -0,0 +1,121 @@
+"""
+Unit tests for InitializationStage's ROOT find-or-create transaction function.
+"""
+import re
+
+from asr_got_reimagined.config import settings
+from asr_got_reimagined.domain.stages.stage_1_initialization import (
+    _CREATE_ROOT_Q,
+    _FIND_ROOT_Q,
+    _UPDATE_TAGS_Q,
+    InitializationStage,
+)
+
+
+def _labels_on_n(query):
+    """Returns every label the query attaches to (or requires of) the variable `n`."""
+    labels = set()
+    for chain in re.findall(r"\bn((?::`?\w+`?)+)", query):
+        labels.update(label.strip("`") for label in chain.split(":") if label)
+    return labels
+
+
+class _Result:
+    def __init__(self, record):
+        self._record = record
+
+    async def single(self):
+        return self._record
+
+
+class _InMemoryRootTx:
+    """
+    Stands in for an AsyncManagedTransaction running stage 1's three statements. Nodes keep
+    the labels the create statement gives them, and reads only see nodes carrying every
+    label the read statement names, as in Neo4j.
+
+    `concurrent_root` props, if given, are committed as another session's ROOT right after
+    the first lookup misses, i.e. between this transaction's lookup and its create MERGE.
+    """
+
+    def __init__(self, concurrent_root=None):
+        self.nodes = []
+        self._concurrent_root = concurrent_root
+
+    def _matching(self, query, **props):
+        required = _labels_on_n(query)
+        return [
+            node for node in self.nodes
+            if required <= node["labels"] and all(node["props"].get(k) == v for k, v in props.items())
+        ]
+
+    async def run(self, query, parameters):
+        if query == _CREATE_ROOT_Q:
+            # MERGE on the query context: an existing ROOT is returned unchanged (no ON CREATE SET)
+            props = dict(parameters["props"])
+            for node in self._matching(query, metadata_query_context=props["metadata_query_context"]):
+                return _Result({"new_node_id": node["props"]["id"]})
+            self.nodes.append({"labels": _labels_on_n(query), "props": props})
+            return _Result({"new_node_id": props["id"]})
+        if query == _FIND_ROOT_Q:
+            for node in self._matching(query, metadata_query_context=parameters["initial_query"]):
+                props = node["props"]
+                return _Result({
+                    "nodeId": props["id"], "current_tags": props.get("metadata_disciplinary_tags"),
+                    "label": props["label"], "layer_id": props.get("metadata_layer_id"),
+                })
+            if self._concurrent_root is not None:
+                self.nodes.append({"labels": _labels_on_n(_CREATE_ROOT_Q), "props": self._concurrent_root})
+                self._concurrent_root = None
+            return _Result(None)
+        if query == _UPDATE_TAGS_Q:
+            for node in self._matching(query, id=parameters["node_id"]):
+                node["props"]["metadata_disciplinary_tags"] = parameters["tags"]
+                return _Result({"updated_tags": parameters["tags"]})
+            return _Result(None)
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+async def test_created_root_is_found_again():
+    stage = InitializationStage(settings)
+    tx = _InMemoryRootTx()
+
+    created = await stage._find_or_create_root_tx(tx, "What causes X?", {"initial_disciplinary_tags": ["b", "a"]})
+    found = await stage._find_or_create_root_tx(tx, "What causes X?", {"initial_disciplinary_tags": ["a"]})
+
+    assert created["used_existing"] is False
+    assert found["used_existing"] is True
+    assert found["updated_tags"] is False
+    assert found["node_id"] == created["node_id"]
+    assert found["tags"] == ("a", "b")
+    assert found["root_node_properties"] == created["root_node_properties"]
+    assert len(tx.nodes) == 1
+
+
+async def test_found_root_gains_new_tags():
+    stage = InitializationStage(settings)
+    tx = _InMemoryRootTx()
+
+    created = await stage._find_or_create_root_tx(tx, "What causes X?", {"initial_disciplinary_tags": ["b"]})
+    updated = await stage._find_or_create_root_tx(tx, "What causes X?", {"initial_disciplinary_tags": ["c", "a"]})
+
+    assert updated["node_id"] == created["node_id"]
+    assert updated["updated_tags"] is True
+    assert updated["tags"] == ("a", "b", "c")
+    assert tx.nodes[0]["props"]["metadata_disciplinary_tags"] == ["a", "b", "c"]
+
+
+async def test_root_created_concurrently_is_reused():
+    stage = InitializationStage(settings)
+    other_root = {
+        "id": "other-session-root", "label": "Task Understanding", "metadata_query_context": "What causes X?",
+        "metadata_disciplinary_tags": ["b"], "metadata_layer_id": "root_layer",
+    }
+    tx = _InMemoryRootTx(concurrent_root=other_root)
+
+    outcome = await stage._find_or_create_root_tx(tx, "What causes X?", {"initial_disciplinary_tags": ["a"]})
+
+    assert outcome["node_id"] == "other-session-root"
+    assert outcome["used_existing"] is True
+    assert outcome["tags"] == ("a", "b")
+    assert len(tx.nodes) == 1